@@ -104,12 +104,10 @@ class SelectButton(QtWidgets.QLabel):
         """
         if not self.view().selectionModel().hasSelection():
             self.setText(self._label)
-            self.update()
             return
         index = self.view().selectionModel().currentIndex()
         if not index.isValid():
             self.setText(self._label)
-            self.update()
             return
         if isinstance(index.model(), SelectFolderModel):
             if index.column() != 0:
@@ -120,13 +118,11 @@ class SelectButton(QtWidgets.QLabel):
                 self.view().selectionModel().setCurrentIndex(
                     QtCore.QModelIndex(), QtCore.QItemSelectionModel.Clear)
                 self.setText(self._label)
-                self.update()
                 return
             text = file_path.lower().replace(root_path.lower(), u'').strip('/')
         else:
             text = index.data(QtCore.Qt.DisplayRole)
         self.setText(text)
-        self.update()
 
     @QtCore.Slot()
     def select_active(self):
@@ -499,6 +495,7 @@ class SelectFolderModel(QtWidgets.QFileSystemModel):
 
     def __init__(self, parent=None):
         super(SelectFolderModel, self).__init__(parent=parent)
+        self._row_size = QtCore.QSize(1, common.ROW_HEIGHT() * 0.8)
         self.setNameFilterDisables(True)
         self.setIconProvider(SelectFolderModelIconProvider(parent=self))
 
@@ -534,7 +531,7 @@ class SelectFolderModel(QtWidgets.QFileSystemModel):
                     return data.upper()
 
         if role == QtCore.Qt.SizeHintRole and index.column() == 0:
-            return QtCore.QSize(1, common.ROW_HEIGHT() * 0.8)
+            return self._row_size
         return super(SelectFolderModel, self).data(index, role=role)
 
 
@@ -562,10 +559,8 @@ class SelectFolderView(QtWidgets.QTreeView):
         self.setUniformRowHeights(True)
         self.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
 
-        self.header().setDefaultSectionSize(common.WIDTH() * 0.5)
         self.header().setDefaultSectionSize(common.WIDTH() * 0.5)
 
-        self.header().setSectionResizeMode(1, QtWidgets.QHeaderView.Fixed)
         self.header().setSectionResizeMode(1, QtWidgets.QHeaderView.Fixed)
         self.header().setSectionResizeMode(2, QtWidgets.QHeaderView.Fixed)
         self.header().setSectionResizeMode(3, QtWidgets.QHeaderView.Fixed)
@@ -721,13 +716,9 @@ class SelectFolderView(QtWidgets.QTreeView):
         margins = self.viewportMargins().top() + self.viewportMargins().bottom()
         margins += self.getContentsMargins()[1] + self.getContentsMargins()[3]
 
-        option = QtWidgets.QStyleOptionViewItem()
-        option.initFrom(self)
-        #
         index = self.rootIndex()
         while True:
             index = self.indexBelow(index)
-            index.data(QtCore.Qt.DisplayRole)
             row_height += self.rowHeight(index)
             if not index.isValid():
                 break
@@ -762,6 +753,11 @@ class SelectFolderView(QtWidgets.QTreeView):
         if not path:
             return
 
+        # Re-setting the same root would only restart the directory loading
+        # and selection restore cascade
+        if path == self.model().rootPath():
+            return
+
         self.model().setRootPath(path)
         index = self.model().index(path)
         self.setRootIndex(index)
@@ -861,7 +857,9 @@ class ThumbnailButton(common_ui.ClickableIconButton):
             description=description,
             parent=parent
         )
-        self.thumbnail = QtGui.QImage()
+        self.thumbnail = None
+        self._thumbnail_pixmap = None
+        self._thumbnail_key = None
 
         tip = u'Right-click to add a thumbnail...'
         self.setToolTip(tip)
@@ -881,16 +879,25 @@ class ThumbnailButton(common_ui.ClickableIconButton):
         return True
 
     def reset_thumbnail(self):
-        self.thumbnail = QtGui.QImage()
+        self.thumbnail = None
         self.update()
 
     def pixmap(self):
-        if self.thumbnail.isNull():
+        if self.thumbnail is None or self.thumbnail.isNull():
             return images.ImageCache.get_rsc_pixmap('placeholder', None, self.rect().height(), opacity=0.2)
+
+        # The button is repainted on every enter and leave event so we'll keep
+        # the converted pixmap around until the thumbnail image changes
+        if self._thumbnail_key == self.thumbnail.cacheKey():
+            return self._thumbnail_pixmap
+
         pixmap = QtGui.QPixmap()
         pixmap.convertFromImage(self.thumbnail)
         if pixmap.isNull():
             return super(ThumbnailButton, self).pixmap()
+
+        self._thumbnail_key = self.thumbnail.cacheKey()
+        self._thumbnail_pixmap = pixmap
         return pixmap
 
     @QtCore.Slot()
@@ -927,12 +934,11 @@ class ThumbnailButton(common_ui.ClickableIconButton):
                 log.error(s)
                 common_ui.ErrorBox(s, u'').open()
                 raise RuntimeError(s)
-            image = images.ImageCache.get_image(
-                destination,
-                common.THUMBNAIL_IMAGE_SIZE,
-                force=True
-            )
-            if not image:
+
+            # The converted temp file is already sized, there's no need to
+            # validate, resize and cache it via `ImageCache.get_image`
+            image = QtGui.QImage(destination)
+            if image.isNull():
                 log.error(s)
                 common_ui.ErrorBox(s, u'').open()
                 raise RuntimeError(s)
@@ -1167,22 +1173,23 @@ class NameVersionWidget(common_ui.LineEdit):
         ext = self.window().extension.lower()
         name_prefix = self.window().name_prefix_widget.text().lower()
 
+        # `ext`, `name_prefix` and `prefix` are already lower-case and `path`
+        # is lowered once per entry
         for entry in _scandir.scandir(file_info.path()):
-            path = entry.path.replace(u'\\', u'/').lower()
-            basename = path.split(u'/').pop(-1).lower()
-
-            if not basename.lower().startswith(name_prefix.lower()):
+            if not entry.name.lower().startswith(name_prefix):
                 continue
 
+            path = entry.path.replace(u'\\', u'/').lower()
+
             # Let's skip the files with a different extension
-            if not path.lower().endswith(ext.lower()):
+            if not path.endswith(ext):
                 continue
 
             # Skipping files that are not versioned appropiately
-            if prefix.lower() not in path.lower():
+            if prefix not in path:
                 continue
 
-            _match = common.is_valid_filename(path.lower())
+            _match = common.is_valid_filename(path)
             if not _match:
                 continue
             _version = _match.group(5).lower()
@@ -1194,7 +1201,7 @@ class NameVersionWidget(common_ui.LineEdit):
 
         max_version = max(versions)
         if int(version) <= max_version:
-            self.setText(u'{}'.format(max_version + 1).zfill(4))
+            self.setText(u'{:04d}'.format(max_version + 1))
 
 
 class NameUserWidget(common_ui.LineEdit):
@@ -1221,7 +1228,10 @@ class NameUserWidget(common_ui.LineEdit):
         val = settings.local_settings.value(u'saver/username')
         if not val:
             return
+        # Restoring the saved value shouldn't write it straight back
+        self.blockSignals(True)
         self.setText(val)
+        self.blockSignals(False)
 
 
 class NameCustomWidget(common_ui.LineEdit):
@@ -1253,7 +1263,10 @@ class NameCustomWidget(common_ui.LineEdit):
         val = settings.local_settings.value(u'saver/customname')
         if not val:
             return
+        # Restoring the saved value shouldn't write it straight back
+        self.blockSignals(True)
         self.setText(val)
+        self.blockSignals(False)
 
 
 class ToggleCustomNameWidget(QtWidgets.QCheckBox):
@@ -1275,10 +1288,11 @@ class ToggleCustomNameWidget(QtWidgets.QCheckBox):
 
     def showEvent(self, event):  # pylint: disable=W0613
         val = settings.local_settings.value(u'saver/togglecustom')
-        if not val:
-            self.toggled.emit(self.isChecked())
+        # `setChecked` emits `toggled` itself when the state changes, we only
+        # have to emit manually when restoring the value was a no-op
+        if val and not self.isChecked():
+            self.setChecked(val)
             return
-        self.setChecked(val)
         self.toggled.emit(self.isChecked())
 
 
@@ -1296,6 +1310,8 @@ class FilePathWidget(QtWidgets.QWidget):
         self.display_timer.setInterval(200)
         self.display_timer.timeout.connect(self.update_text)
         self._text = u''
+        self._elided_key = None
+        self._elided_text = u''
 
         tip = u'Click to reveal the destination folder in the file explorer'
         self.setToolTip(tip)
@@ -1306,7 +1322,7 @@ class FilePathWidget(QtWidgets.QWidget):
         s = self.window().get_file_path()
         if s != self._text:
             self._text = s
-            self.repaint()
+            self.update()
 
     def showEvent(self, event):  # pylint: disable=W0613
         if not self.display_timer.isActive():
@@ -1349,11 +1365,18 @@ class FilePathWidget(QtWidgets.QWidget):
         rect = self.rect().marginsRemoved(
             QtCore.QMargins(o * 2, o * 2, o * 2, o * 2))
         font, metrics = common.font_db.primary_font(common.MEDIUM_FONT_SIZE())
-        file_path = metrics.elidedText(
-            file_path.upper(),
-            QtCore.Qt.ElideLeft,
-            rect.width()
-        )
+
+        # Hovering repaints the widget without changing the text, so we only
+        # have to elide the path when it or the available width changes
+        k = (file_path, rect.width())
+        if k != self._elided_key:
+            self._elided_key = k
+            self._elided_text = metrics.elidedText(
+                file_path.upper(),
+                QtCore.Qt.ElideLeft,
+                rect.width()
+            )
+        file_path = self._elided_text
 
         align = QtCore.Qt.AlignCenter
         color = common.TEXT if hover else common.ADD
@@ -1365,12 +1388,12 @@ class FilePathWidget(QtWidgets.QWidget):
         if not isinstance(event, QtGui.QMouseEvent):
             return
         file_path = self.window().get_file_path()
-        file_info = QtCore.QFileInfo(file_path)
-
-        if file_info.exists():
-            common.reveal(file_info.filePath())
+        if QtCore.QFileInfo.exists(file_path):
+            common.reveal(file_path)
             return
 
+        file_info = QtCore.QFileInfo(file_path)
+
         common.reveal(file_info.path())
 
 
@@ -1409,12 +1432,25 @@ class AddFileWidget(QtWidgets.QDialog):
         self.initialize_timer.setSingleShot(True)
         self.initialize_timer.setInterval(300)
 
+        # Checking the version means scanning the destination folder, so
+        # keystrokes in the name editors are coalesced into a single check
+        self.check_version_timer = QtCore.QTimer(parent=self)
+        self.check_version_timer.setSingleShot(True)
+        self.check_version_timer.setInterval(150)
+
         self.move_in_progress = False
         self.move_start_position = None
         self.move_start_widget_pos = None
 
         self._file_path = None
         self._file_to_increment = None
+
+        # The fallback user name doesn't change so we won't query it every
+        # time the file path is requested
+        self._default_user = QtCore.QFileInfo(
+            QtCore.QStandardPaths.writableLocation(
+                QtCore.QStandardPaths.HomeLocation)).baseName()
+
         if file:
             self._file_to_increment = QtCore.QFileInfo(file)
             self.increment_file()
@@ -1426,6 +1462,9 @@ class AddFileWidget(QtWidgets.QDialog):
         self.bookmark_widget = None
         self.asset_widget = None
         self.folder_widget = None
+        self.bookmark_view = None
+        self.asset_view = None
+        self.folder_view = None
         #
         self.thumbnail_widget = None
         self.description_editor_widget = None
@@ -1454,18 +1493,18 @@ class AddFileWidget(QtWidgets.QDialog):
         )
 
         # Bookmarks
-        bookmark_view = BookmarksListView(parent=self)
+        self.bookmark_view = BookmarksListView(parent=self)
         self.bookmark_widget = SelectButton(
-            u'Select bookmark...', bookmark_view, parent=self)
+            u'Select bookmark...', self.bookmark_view, parent=self)
 
-        asset_view = AssetsListView(parent=self)
+        self.asset_view = AssetsListView(parent=self)
         self.asset_widget = SelectButton(
-            u'Select asset...', asset_view, parent=self)
+            u'Select asset...', self.asset_view, parent=self)
 
         # Folder
-        folder_view = SelectFolderView(parent=self)
+        self.folder_view = SelectFolderView(parent=self)
         self.folder_widget = SelectButton(
-            u'Select folder...', folder_view, parent=self)
+            u'Select folder...', self.folder_view, parent=self)
 
         self.description_editor_widget = DescriptionEditor(parent=self)
         self.name_mode_widget = NameModeWidget(parent=self)
@@ -1486,21 +1525,22 @@ class AddFileWidget(QtWidgets.QDialog):
         self.cancel_button = common_ui.PaintedButton(u'Cancel', parent=self)
         self.cancel_button.setFixedWidth(common.MARGIN() * 4.5)
 
+        # The top-level layout is only set once all rows have been added
         o = common.MARGIN()
-        QtWidgets.QHBoxLayout(self)
-        self.layout().setContentsMargins(o, o, o, o)
-        self.layout().setSpacing(o * 0.5)
-        self.layout().setAlignment(QtCore.Qt.AlignCenter)
+        layout = QtWidgets.QHBoxLayout()
+        layout.setContentsMargins(o, o, o, o)
+        layout.setSpacing(o * 0.5)
+        layout.setAlignment(QtCore.Qt.AlignCenter)
         self.setFixedWidth(common.WIDTH() * 1.5)
 
-        self.layout().addWidget(self.thumbnail_widget)
-        self.layout().addSpacing(o)
+        layout.addWidget(self.thumbnail_widget)
+        layout.addSpacing(o)
 
         mainrow = QtWidgets.QWidget(parent=self)
         QtWidgets.QVBoxLayout(mainrow)
         mainrow.layout().setContentsMargins(0, 0, 0, 0)
         mainrow.layout().setSpacing(o * 0.5)
-        self.layout().addWidget(mainrow)
+        layout.addWidget(mainrow)
 
         row = common_ui.add_row(
             None,
@@ -1532,7 +1572,7 @@ class AddFileWidget(QtWidgets.QDialog):
         if self._file_to_increment:
             self.thumbnail_widget.hide()
             row.hide()
-            self.folder_widget.view().hide()
+            self.folder_view.hide()
 
         row = common_ui.add_row(
             None,
@@ -1574,74 +1614,85 @@ class AddFileWidget(QtWidgets.QDialog):
         row.layout().addWidget(self.cancel_button, 0)
         mainrow.layout().addSpacing(o)
 
+        self.setLayout(layout)
+
     def _connect_signals(self):
         """Signals are connected together here."""
-        self.bookmark_widget.view().clicked.connect(
-            self.bookmark_widget.view().activated)
-        self.asset_widget.view().clicked.connect(self.asset_widget.view().activated)
+        self.bookmark_view.clicked.connect(
+            self.bookmark_view.activated)
+        self.asset_view.clicked.connect(self.asset_view.activated)
 
-        self.folder_widget.view().doubleClicked.connect(
-            self.folder_widget.view().activated)
+        self.folder_view.doubleClicked.connect(
+            self.folder_view.activated)
 
         self.initialize_timer.timeout.connect(
-            self.bookmark_widget.view().model().sourceModel().modelDataResetRequested)
+            self.bookmark_view.model().sourceModel().modelDataResetRequested)
 
-        self.bookmark_widget.view().clicked.connect(
-            self.asset_widget.view().model().sourceModel().set_active)
-        self.bookmark_widget.view().clicked.connect(
-            self.asset_widget.view().model().sourceModel().modelDataResetRequested)
+        self.bookmark_view.clicked.connect(
+            self.asset_view.model().sourceModel().set_active)
+        self.bookmark_view.clicked.connect(
+            self.asset_view.model().sourceModel().modelDataResetRequested)
 
-        self.asset_widget.view().selectionModel().currentChanged.connect(
-            self.folder_widget.view().set_active)
+        self.asset_view.selectionModel().currentChanged.connect(
+            self.folder_view.set_active)
 
         # Folder model reset
-        self.bookmark_widget.view().model().sourceModel().modelAboutToBeReset.connect(
-            self.folder_widget.view().reset_active)
-        self.asset_widget.view().model().sourceModel().modelAboutToBeReset.connect(
-            self.folder_widget.view().reset_active)
+        self.bookmark_view.model().sourceModel().modelAboutToBeReset.connect(
+            self.folder_view.reset_active)
+        self.asset_view.model().sourceModel().modelAboutToBeReset.connect(
+            self.folder_view.reset_active)
 
-        self.asset_widget.view().model().sourceModel().modelAboutToBeReset.connect(
-            self.folder_widget.view().selectionModel().reset)
+        self.asset_view.model().sourceModel().modelAboutToBeReset.connect(
+            self.folder_view.selectionModel().reset)
 
-        self.folder_widget.view().selectionModel().currentChanged.connect(
+        self.folder_view.selectionModel().currentChanged.connect(
             self.name_mode_widget.folder_changed)
 
         # Version label
-        self.folder_widget.view().clicked.connect(
+        self.folder_view.clicked.connect(
             self.name_version_widget.check_version)
-        self.folder_widget.view().model().directoryLoaded.connect(
+        self.folder_view.model().directoryLoaded.connect(
             self.name_version_widget.check_version)
 
         self.name_mode_widget.activated.connect(
             self.name_version_widget.check_version)
         self.name_mode_widget.activated.connect(
-            lambda x: self.folder_widget.view().set_folder(
+            lambda x: self.folder_view.set_folder(
                 self.name_mode_widget.itemData(x, role=QtCore.Qt.StatusTipRole)))
 
-        self.name_prefix_widget.textChanged.connect(
+        self.check_version_timer.timeout.connect(
             self.name_version_widget.check_version)
+        self.name_prefix_widget.textChanged.connect(
+            lambda x: self.check_version_timer.start())
         self.name_user_widget.textChanged.connect(
-            self.name_version_widget.check_version)
+            lambda x: self.check_version_timer.start())
 
         # Buttons
         self.cancel_button.clicked.connect(self.reject)
         self.save_button.clicked.connect(self.accept)
 
-        t = self.toggle_custom_name_widget
-        t.toggled.connect(self.name_mode_widget.setHidden)
-        t.toggled.connect(self.name_version_widget.setHidden)
-        t.toggled.connect(self.name_user_widget.setHidden)
-        t.toggled.connect(lambda x: self.name_custom_widget.setHidden(not x))
-        t.toggled.connect(self.name_custom_widget.shown)
+        self.toggle_custom_name_widget.toggled.connect(
+            self.toggle_custom_name)
 
-        # self.bookmark_widget.view().model().sourceModel().modelReset.connect(
+        # self.bookmark_view.model().sourceModel().modelReset.connect(
         #     self.set_prefix)
 
-        self.bookmark_widget.view().selectionModel().currentChanged.connect(
+        self.bookmark_view.selectionModel().currentChanged.connect(
             self.set_prefix)
-        self.bookmark_widget.view().model().sourceModel().activeChanged.connect(
+        self.bookmark_view.model().sourceModel().activeChanged.connect(
             self.set_prefix)
 
+    @QtCore.Slot(bool)
+    def toggle_custom_name(self, state):
+        """Shows or hides the name editors based on the custom name toggle.
+
+        """
+        self.name_mode_widget.setHidden(state)
+        self.name_version_widget.setHidden(state)
+        self.name_user_widget.setHidden(state)
+        self.name_custom_widget.setHidden(not state)
+        self.name_custom_widget.shown()
+
     @QtCore.Slot()
     def set_prefix(self, index):
         """Sets the file-prefix based on the given bookmark selection.
@@ -1649,11 +1700,8 @@ class AddFileWidget(QtWidgets.QDialog):
         """
         if not index.isValid():
             return
-        db = bookmark_db.get_db(
-            index.data(common.ParentPathRole)[0],
-            index.data(common.ParentPathRole)[1],
-            index.data(common.ParentPathRole)[2],
-        )
+        server, job, root = index.data(common.ParentPathRole)[0:3]
+        db = bookmark_db.get_db(server, job, root)
         prefix = db.value(1, u'prefix', table='properties')
         self.name_prefix_widget.setText(prefix)
 
@@ -1665,35 +1713,32 @@ class AddFileWidget(QtWidgets.QDialog):
         seq = common.get_sequence(self._file_to_increment.filePath())
         if not seq:
             idx = 1
-            _file_info = QtCore.QFileInfo(self._file_to_increment)
             while True:
                 path = u'{folder}/{name}_v{idx}.{ext}'.format(
                     folder=self._file_to_increment.path(),
                     name=self._file_to_increment.baseName(),
-                    idx=u'{}'.format(idx).zfill(4),
+                    idx=u'{:04d}'.format(idx),
                     ext=self._file_to_increment.suffix()
                 )
-                _file_info = QtCore.QFileInfo(path)
-                if not _file_info.exists():
+                if not QtCore.QFileInfo.exists(path):
                     break
                 idx += 1
-            self._file_to_increment = _file_info
+            self._file_to_increment = QtCore.QFileInfo(path)
             return
 
         idx = int(seq.group(2))
-        _file_info = QtCore.QFileInfo(self._file_to_increment.filePath())
+        padding = len(seq.group(2))
         while True:
             path = u'{before}{idx}{after}.{ext}'.format(
                 before=seq.group(1),
-                idx=u'{}'.format(idx).zfill(len(seq.group(2))),
+                idx=u'{:0{}d}'.format(idx, padding),
                 after=seq.group(3),
                 ext=self._file_to_increment.suffix()
             )
-            _file_info = QtCore.QFileInfo(path)
-            if not _file_info.exists():
+            if not QtCore.QFileInfo.exists(path):
                 break
             idx += 1
-        self._file_to_increment = _file_info
+        self._file_to_increment = QtCore.QFileInfo(path)
 
     def filePath(self):
         """The currently set file-path."""
@@ -1704,12 +1749,12 @@ class AddFileWidget(QtWidgets.QDialog):
         if self._file_to_increment:
             return None
 
-        if not self.folder_widget.view().selectionModel().hasSelection():
+        if not self.folder_view.selectionModel().hasSelection():
             return None
 
-        root_path = self.folder_widget.view().model().rootPath()
-        base_path = self.folder_widget.view().model().filePath(
-            self.folder_widget.view().selectionModel().currentIndex()
+        root_path = self.folder_view.model().rootPath()
+        base_path = self.folder_view.model().filePath(
+            self.folder_view.selectionModel().currentIndex()
         )
 
         task_folder = base_path.replace(root_path, u'').strip(u'/')
@@ -1734,7 +1779,7 @@ class AddFileWidget(QtWidgets.QDialog):
         """
         if self._file_to_increment:
             return self._file_to_increment.filePath()
-        folder = self.folder_widget.view().selectionModel().currentIndex()
+        folder = self.folder_view.selectionModel().currentIndex()
         folder = folder.data(
             QtWidgets.QFileSystemModel.FilePathRole) if folder.isValid() else u''
 
@@ -1745,22 +1790,18 @@ class AddFileWidget(QtWidgets.QDialog):
                 ext=self.extension)
             return self._file_path
 
-        asset = self.asset_widget.view().selectionModel().currentIndex()
+        asset = self.asset_view.selectionModel().currentIndex()
+        parent_path = asset.data(common.ParentPathRole)
         # The model might still be loading...
-        if asset.data(common.ParentPathRole) is None:
+        if parent_path is None:
             return None
 
-        asset = asset.data(
-            common.ParentPathRole)[-1] if asset.isValid() else u''
+        asset = parent_path[-1] if asset.isValid() else u''
         _mode = self.name_mode_widget.currentIndex()
         _mode = self.name_mode_widget.currentData(
             QtCore.Qt.DisplayRole).lower() if _mode != -1 else u''
-        _user = QtCore.QStandardPaths.writableLocation(
-            QtCore.QStandardPaths.HomeLocation)
-        _user = QtCore.QFileInfo(_user)
-        _user = _user.baseName()
         user = self.name_user_widget.text()
-        user = user if user else _user
+        user = user if user else self._default_user
         version = u'{}'.format(self.name_version_widget.text()).zfill(4)
         version = u'v{}'.format(version)
 
@@ -1803,7 +1844,7 @@ class AddFileWidget(QtWidgets.QDialog):
         validity of the selections so there no need to do it again.
 
         """
-        index = self.bookmark_widget.view().selectionModel().currentIndex()
+        index = self.bookmark_view.selectionModel().currentIndex()
         if not index.isValid():
             return
 
@@ -1819,8 +1860,9 @@ class AddFileWidget(QtWidgets.QDialog):
             file_path
         )
 
-        if not self.thumbnail_widget.thumbnail.isNull():
-            res = self.thumbnail_widget.thumbnail.save(
+        thumbnail = self.thumbnail_widget.thumbnail
+        if thumbnail is not None and not thumbnail.isNull():
+            res = thumbnail.save(
                 destination,
                 format=u'png',
                 quality=100
@@ -1851,14 +1893,14 @@ class AddFileWidget(QtWidgets.QDialog):
             return
 
         # A folder selection is a must
-        if not self.asset_widget.view().selectionModel().hasSelection():
+        if not self.asset_view.selectionModel().hasSelection():
             common_ui.MessageBox(
                 u'Asset not selected.',
                 u'Select an asset from the dropdown menu and try again.',
             ).open()
             return
         # A folder selection is a must
-        if not self.asset_widget.view().selectionModel().currentIndex():
+        if not self.asset_view.selectionModel().currentIndex():
             common_ui.MessageBox(
                 u'Asset not selected.',
                 u'Select an asset from the dropdown menu and try again.',
@@ -1866,14 +1908,14 @@ class AddFileWidget(QtWidgets.QDialog):
             return
 
         # A folder selection is a must
-        if not self.folder_widget.view().selectionModel().hasSelection():
+        if not self.folder_view.selectionModel().hasSelection():
             common_ui.MessageBox(
                 u'Destination folder not set.',
                 u'Select a folder from the dropdown menu and try again.',
             ).open()
             return
 
-        index = self.folder_widget.view().selectionModel().currentIndex()
+        index = self.folder_view.selectionModel().currentIndex()
         if not index.isValid():
             common_ui.MessageBox(
                 u'Destination folder not selected.',
@@ -1884,7 +1926,7 @@ class AddFileWidget(QtWidgets.QDialog):
             index = index.sibling(index.row(), 0)
 
         # Let's check if the folder exists and is writable...
-        path = self.folder_widget.view().model().filePath(index)
+        path = self.folder_view.model().filePath(index)
         file_info = QtCore.QFileInfo(path)
         _file_info = QtCore.QFileInfo(file_info.path())
 
@@ -1922,16 +1964,14 @@ class AddFileWidget(QtWidgets.QDialog):
 
                 import bookmarks.bookmark_properties as bookmark_properties
 
-                model = self.bookmark_widget.view().model().sourceModel()
+                model = self.bookmark_view.model().sourceModel()
                 index = model.active_index()
                 if not index.isValid():
                     return
 
+                server, job, root = index.data(common.ParentPathRole)[0:3]
                 bookmark_properties.BookmarkPropertiesWidget(
-                    index.data(common.ParentPathRole)[0],
-                    index.data(common.ParentPathRole)[1],
-                    index.data(common.ParentPathRole)[2],
-                ).exec_()
+                    server, job, root).exec_()
                 self.set_prefix(index)
                 return
 
@@ -1939,8 +1979,9 @@ class AddFileWidget(QtWidgets.QDialog):
         # an existing file first...
         file_path = self.get_file_path()
         file_info = QtCore.QFileInfo(file_path)
+        exists = QtCore.QFileInfo.exists(file_path)
 
-        if file_info.exists() and not self.toggle_custom_name_widget.isChecked():
+        if exists and not self.toggle_custom_name_widget.isChecked():
             match = common.is_valid_filename(file_path)
             if not match:
                 return
@@ -1950,20 +1991,15 @@ class AddFileWidget(QtWidgets.QDialog):
             version = u'{}'.format(version).zfill(4)
             version = u'v{}'.format(version)
 
-            mbox = QtWidgets.QMessageBox(parent=self)
-            mbox.setWindowTitle(u'Couldn\'t save file')
-            mbox.setIcon(QtWidgets.QMessageBox.Warning)
-            mbox.setText(u'A file named "{}" exists already!'.format(
-                file_info.fileName()))
-            mbox.setInformativeText(
-                u'Do you want to increment version "{}"?'.format(version))
-            button = mbox.addButton(
-                u'Increment and save', QtWidgets.QMessageBox.AcceptRole)
-            mbox.addButton(u'Cancel', QtWidgets.QMessageBox.RejectRole)
-            mbox.setDefaultButton(button)
-
-            res = mbox.exec_()
-            if res == QtWidgets.QMessageBox.RejectRole:
+            res = QtWidgets.QMessageBox.question(
+                self,
+                u'Couldn\'t save file',
+                u'A file named "{}" exists already!\nDo you want to increment version "{}"?'.format(
+                    file_info.fileName(), version),
+                QtWidgets.QMessageBox.Save | QtWidgets.QMessageBox.Cancel,
+                QtWidgets.QMessageBox.Save
+            )
+            if res != QtWidgets.QMessageBox.Save:
                 return
 
             # Let's increment the number
@@ -1978,17 +2014,22 @@ class AddFileWidget(QtWidgets.QDialog):
                 return
             new_version = u'v' + match.group(5)
 
-            mbox = QtWidgets.QMessageBox(parent=self)
-            mbox.setWindowTitle(u'Version changed')
-            mbox.setIcon(QtWidgets.QMessageBox.Warning)
-            mbox.setText(u'Version incremented from "{}" to "{}"'.format(
-                version, new_version))
-            mbox.open()
+            QtWidgets.QMessageBox.information(
+                self,
+                u'Version changed',
+                u'Version incremented from "{}" to "{}"'.format(
+                    version, new_version)
+            )
+            # The re-run saves and accepts the incremented file
             self.accept()
+            return
 
-        if file_info.exists() and self.toggle_custom_name_widget.isChecked():
-            self.message_box(
-                u'A file named "{}" exists already!'.format(file_info.fileName()))
+        if exists and self.toggle_custom_name_widget.isChecked():
+            common_ui.MessageBox(
+                u'A file named "{}" exists already!'.format(
+                    file_info.fileName()),
+                u'Enter another name and try again.',
+            ).open()
             self.name_custom_widget.setFocus()
             self.name_custom_widget.selectAll()
             return
@@ -283,8 +283,6 @@ class BaseContextMenu(QtWidgets.QMenu):
 
         copy_icon = images.ImageCache.get_rsc_pixmap(
             u'copy', common.SECONDARY_TEXT, common.MARGIN())
-        copy_icon2 = images.ImageCache.get_rsc_pixmap(
-            u'copy', common.SECONDARY_TEXT, common.MARGIN())
 
         key = u'Copy path'
         menu_set[key] = collections.OrderedDict()
@@ -294,7 +292,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'windows1'] = {
             u'text': u'Windows:  {}'.format(
                 common.copy_path(path, mode=common.WindowsPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -303,7 +301,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'unix'] = {
             u'text': u'Unix:  {}'.format(
                 common.copy_path(path, mode=common.UnixPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -313,7 +311,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'slack'] = {
             u'text': u'URL:  {}'.format(
                 common.copy_path(path, mode=common.SlackPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -323,7 +321,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'macos'] = {
             u'text': u'SMB:  {}'.format(
                 common.copy_path(path, mode=common.MacOSPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -333,11 +331,11 @@ class BaseContextMenu(QtWidgets.QMenu):
 
         menu_set[key][u'separator+'] = {}
 
-        path = QtCore.QFileInfo(path).dir().path()
+        path = QtCore.QFileInfo(path).path()
         menu_set[key][u'parent_windows1'] = {
             u'text': u'Windows:  {}'.format(
                 common.copy_path(path, mode=common.WindowsPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -346,7 +344,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'parent_unix'] = {
             u'text': u'Unix:  {}'.format(
                 common.copy_path(path, mode=common.UnixPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -356,7 +354,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'parent_slack'] = {
             u'text': u'URL:  {}'.format(
                 common.copy_path(path, mode=common.SlackPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
@@ -366,7 +364,7 @@ class BaseContextMenu(QtWidgets.QMenu):
         menu_set[key][u'parent_macos'] = {
             u'text': u'SMB:  {}'.format(
                 common.copy_path(path, mode=common.MacOSPath, copy=False)),
-            u'icon': copy_icon2,
+            u'icon': copy_icon,
             u'action': functools.partial(
                 common.copy_path,
                 path,
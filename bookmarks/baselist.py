@@ -909,6 +909,7 @@ class BaseListWidget(QtWidgets.QListView):
 
         self._thumbnail_drop = (-1, False)  # row, accepted
         self._background_icon = u'icon_bw'
+        self._background_pixmap = None
         self._generate_thumbnails_enabled = True
         self.progress_widget = ProgressWidget(parent=self)
         self.progress_widget.setHidden(True)
@@ -1259,15 +1260,14 @@ class BaseListWidget(QtWidgets.QListView):
                 db.setValue(k, u'flags', f)
 
         def save_to_local_settings(k, mode, flag):
-            favourites = settings.local_settings.favourites()
-            sfavourites = set(favourites)
+            favourites = set(settings.local_settings.favourites())
+            k = k.strip().lower()
             if mode:
-                favourites.append(k.strip().lower())
+                favourites.add(k)
             else:
-                if k.lower() in sfavourites:
-                    favourites.remove(k.strip().lower())
+                favourites.discard(k)
 
-            v = sorted(list(set(favourites)))
+            v = sorted(favourites)
             settings.local_settings.setValue(u'favourites', v)
 
         def save_active(k, mode, flag):
@@ -1932,8 +1932,10 @@ class BaseListWidget(QtWidgets.QListView):
     def paint_background_icon(self, widget, event):
         painter = QtGui.QPainter()
         painter.begin(self)
-        pixmap = images.ImageCache.get_rsc_pixmap(
-            self._background_icon, BACKGROUND_COLOR, common.ROW_HEIGHT() * 3)
+        if self._background_pixmap is None:
+            self._background_pixmap = images.ImageCache.get_rsc_pixmap(
+                self._background_icon, BACKGROUND_COLOR, common.ROW_HEIGHT() * 3)
+        pixmap = self._background_pixmap
         rect = pixmap.rect()
         rect.moveCenter(self.rect().center())
         painter.drawPixmap(rect, pixmap, pixmap.rect())
@@ -45,12 +45,20 @@ MAXITEMS = 999999
 SEQPROXY = u'[0]'
 """"""
 
+_oiio_namefilters = None
+
 
 def get_oiio_namefilters():
     """Gets all accepted formats from the oiio build as a namefilter list.
     Use the return value on the QFileDialog.setNameFilters() method.
 
+    The value is only built once and cached for subsequent calls.
+
     """
+    global _oiio_namefilters
+    if _oiio_namefilters is not None:
+        return _oiio_namefilters
+
     extension_list = OpenImageIO.get_string_attribute("extension_list")
     namefilters = []
     arr = []
@@ -67,7 +75,8 @@ def get_oiio_namefilters():
     allfiles = u' '.join(allfiles)
     allfiles = u'All files ({})'.format(allfiles)
     namefilters.insert(0, allfiles)
-    return u';;'.join(namefilters)
+    _oiio_namefilters = u';;'.join(namefilters)
+    return _oiio_namefilters
 
 
 # Extending the
@@ -102,17 +111,21 @@ SORT_WITH_BASENAME = False
 ValidFilenameRegex = re.compile(
     ur'^.*([a-zA-Z0-9]+?)\_(.*)\_(.+?)\_([a-zA-Z0-9]+)\_v([0-9]{1,4})\.([a-zA-Z0-9]+$)',
     flags=re.IGNORECASE | re.UNICODE)
+# The sequence patterns contain no letters and don't need re.IGNORECASE, it
+# would only make the engine fold the case of every character it tests
 IsSequenceRegex = re.compile(
-    ur'^(.+?)(\[.*\])(.*)$', flags=re.IGNORECASE | re.UNICODE)
+    ur'^(.+?)(\[.*\])(.*)$', flags=re.UNICODE)
 SequenceStartRegex = re.compile(
     ur'^(.*)\[([0-9]+).*\](.*)$',
-    flags=re.IGNORECASE | re.UNICODE)
+    flags=re.UNICODE)
 SequenceEndRegex = re.compile(
     ur'^(.*)\[.*?([0-9]+)\](.*)$',
-    flags=re.IGNORECASE | re.UNICODE)
+    flags=re.UNICODE)
 GetSequenceRegex = re.compile(
     ur'^(.*?)([0-9]+)([0-9\\/]*|[^0-9\\/]*(?=.+?))\.([^\.]{1,})$',
-    flags=re.IGNORECASE | re.UNICODE)
+    flags=re.UNICODE)
+NameKeyRegex = re.compile(ur'([0-9]+)', flags=re.UNICODE)
+InvalidUsernameRegex = re.compile(ur'[^a-zA-Z0-9]+', flags=re.UNICODE)
 
 
 WindowsPath = 0
@@ -120,6 +133,8 @@ UnixPath = WindowsPath + 1
 SlackPath = UnixPath + 1
 MacOSPath = SlackPath + 1
 
+_platform = None
+
 
 def get_platform():
     """Returns the name of the current platform.
@@ -131,11 +146,17 @@ def get_platform():
         NotImplementedError: If the current platform is not supported.
 
     """
+    global _platform
+    if _platform is not None:
+        return _platform
+
     ptype = QtCore.QSysInfo().productType().lower()
     if ptype in (u'darwin', u'osx', u'macos'):
-        return u'mac'
+        _platform = u'mac'
+        return _platform
     if u'win' in ptype:
-        return u'win'
+        _platform = u'win'
+        return _platform
     raise NotImplementedError(
         u'The platform "{}" is not supported'.format(ptype))
 
@@ -153,6 +174,8 @@ if get_platform() == u'mac':
     DPI = 96.0
 else:
     DPI = 72.0
+DPI_SCALE = DPI / 72.0
+"""The platform's DPI relative to the 72dpi the UI values are defined at."""
 
 
 def SMALL_FONT_SIZE(): return int(psize(11.0))  # 8.5pt@72dbpi
@@ -214,10 +237,11 @@ TRANSPARENT = QtGui.QColor(0, 0, 0, 0)
 
 def psize(n):
     """Returns a scaled UI value.
-    All UI values are assumed to be in `pixels`.
+    All UI values are assumed to be in `pixels`. The DPI factor is resolved
+    at import, only :const:`.UI_SCALE` is read on every call.
 
     """
-    return (float(n) * (float(DPI) / 72.0)) * float(UI_SCALE)
+    return (float(n) * DPI_SCALE) * float(UI_SCALE)
 
 
 HASH_DATA = {}
@@ -304,12 +328,16 @@ def proxy_path(v):
     collapsed = is_collapsed(v)
     if collapsed:
         return collapsed.group(1) + SEQPROXY + collapsed.group(3)
-    seq = get_sequence(v)
+    # We know the path isn't collapsed, no need to check again
+    seq = GetSequenceRegex.search(v)
     if seq:
         return seq.group(1) + SEQPROXY + seq.group(3) + u'.' + seq.group(4)
     return v
 
 
+RGB_CACHE = {}
+
+
 def rgb(color):
     """Returns an rgba string representation of the given color.
 
@@ -320,14 +348,16 @@ def rgb(color):
         unicode: The string representation of the color./
 
     """
-    return u'{},{},{},{}'.format(*color.getRgb())
+    k = color.rgba()
+    if k not in RGB_CACHE:
+        RGB_CACHE[k] = u'{},{},{},{}'.format(*color.getRgb())
+    return RGB_CACHE[k]
 
 
 def get_username():
     """Get the name of the currently logged-in user."""
     n = QtCore.QFileInfo(os.path.expanduser(u'~')).fileName()
-    n = re.sub(ur'[^a-zA-Z0-9]*', u'', n, flags=re.IGNORECASE | re.UNICODE)
-    return n
+    return InvalidUsernameRegex.sub(u'', n)
 
 
 def create_temp_dir():
@@ -370,15 +400,16 @@ def export_favourites():
         zip_path = u'{}/{}/{}/{}.zip'.format(server, job, root, uuid.uuid4())
 
         # Make sure the temp folder exists
-        QtCore.QFileInfo(zip_path).dir().mkpath(u'.')
+        if not os.path.isdir(os.path.dirname(zip_path)):
+            os.makedirs(os.path.dirname(zip_path))
 
         with zipfile.ZipFile(zip_path, 'a') as z:
             # Adding thumbnail to zip
             for favourite in favourites:
-                file_info = QtCore.QFileInfo(db.thumbnail_path(favourite))
-                if not file_info.exists():
+                thumbnail_path = db.thumbnail_path(favourite)
+                if not os.path.isfile(thumbnail_path):
                     continue
-                z.write(file_info.filePath(), file_info.fileName())
+                z.write(thumbnail_path, os.path.basename(thumbnail_path))
             z.writestr(u'favourites', u'\n'.join(favourites))
 
         file_info = QtCore.QFileInfo(zip_path)
@@ -428,8 +459,7 @@ def import_favourites(source=None):
         create_temp_dir()
 
         with zipfile.ZipFile(source) as zip:
-            namelist = zip.namelist()
-            namelist = [f.lower() for f in namelist]
+            namelist = set(f.lower() for f in zip.namelist())
 
             if u'favourites' not in namelist:
                 import bookmarks.log as log
@@ -448,17 +478,19 @@ def import_favourites(source=None):
 
             server, job, root = get_favourite_parent_paths()
             db = bookmark_db.get_db(server, job, root)
+            dest = u'{}/{}/{}/.bookmark'.format(server, job, root)
+            members = []
             for favourite in favourites:
                 file_info = QtCore.QFileInfo(db.thumbnail_path(favourite))
                 if file_info.fileName().lower() in namelist:
-                    dest = u'{}/{}/{}/.bookmark'.format(server, job, root)
-                    zip.extract(file_info.fileName(), dest)
-
-                if favourite not in current_favourites:
-                    current_favourites.append(favourite)
+                    members.append(file_info.fileName())
+            if members:
+                zip.extractall(dest, members=members)
 
-            current_favourites = sorted(list(set(current_favourites)))
-            settings.local_settings.setValue(u'favourites', current_favourites)
+            current_favourites = set(current_favourites)
+            current_favourites.update(favourites)
+            settings.local_settings.setValue(
+                u'favourites', sorted(current_favourites))
 
     except Exception as e:
         import bookmarks.log as log
@@ -496,11 +528,11 @@ def qlast_modified(n): return QtCore.QDateTime.fromMSecsSinceEpoch(n * 1000)
 def namekey(s):
     """Key function used to sort alphanumeric filenames."""
     if SORT_WITH_BASENAME:
-        s = s.split(u'/').pop()  # order by filename
+        s = s.rpartition(u'/')[2]  # order by filename
+        n = 0
     else:
-        n = len(s.split(u'/'))
-        s = ((u'Ω' * (n - 1)) + s)  # order by number of subfolders, then name
-    return [int(f) if f.isdigit() else f for f in s]
+        n = s.count(u'/')  # order by number of subfolders, then name
+    return (n, [int(f) if f.isdigit() else f for f in NameKeyRegex.split(s)])
 
 
 def move_widget_to_available_geo(widget):
@@ -539,24 +571,41 @@ def move_widget_to_available_geo(widget):
     widget.move(x, y)
 
 
+STYLESHEET = {}
+"""The rendered stylesheets keyed by the UI scale they were created with."""
+
+_stylesheet_template = None
+
+
 def set_custom_stylesheet(widget):
-    """Applies the app's custom stylesheet to the given widget."""
+    """Applies the app's custom stylesheet to the given widget.
+
+    The stylesheet file is only read once and formatted once per UI scale
+    value.
+
+    """
+    if UI_SCALE in STYLESHEET:
+        widget.setStyleSheet(STYLESHEET[UI_SCALE])
+        return
+
     import bookmarks.images as images
 
-    path = os.path.normpath(
-        os.path.abspath(
-            os.path.join(
-                __file__,
-                os.pardir,
-                u'rsc',
-                u'customStylesheet.css'
+    global _stylesheet_template
+    if _stylesheet_template is None:
+        path = os.path.normpath(
+            os.path.abspath(
+                os.path.join(
+                    __file__,
+                    os.pardir,
+                    u'rsc',
+                    u'customStylesheet.css'
+                )
             )
         )
-    )
-    with open(path, 'r') as f:
-        f.seek(0)
-        qss = f.read()
-        qss = qss.encode(encoding='UTF-8', errors='strict')
+        with open(path, 'r') as f:
+            qss = f.read()
+            _stylesheet_template = qss.encode(encoding='UTF-8', errors='strict')
+    qss = _stylesheet_template
 
     try:
         qss = qss.format(
@@ -597,16 +646,21 @@ def set_custom_stylesheet(widget):
             err)
         log.error(msg)
         raise KeyError(msg)
+
+    STYLESHEET[UI_SCALE] = qss
     widget.setStyleSheet(qss)
 
 
+BYTE_UNITS = (u'', u'K', u'M', u'G', u'T', u'P', u'E', u'Z')
+
+
 def byte_to_string(num, suffix=u'B'):
     """Converts a numeric byte - value to a human readable string."""
-    for unit in [u'', u'K', u'M', u'G', u'T', u'P', u'E', u'Z']:
-        if abs(num) < 1024.0:
-            return u"%3.1f%s%s" % (num, unit, suffix)
-        num /= 1024.0
-    return u"%.1f%s%s" % (num, u'Yi', suffix)
+    # Every unit is 2^10 times the previous one
+    idx = max(0, (int(abs(num)).bit_length() - 1) // 10)
+    if idx < len(BYTE_UNITS):
+        return u"%3.1f%s%s" % (num / float(1 << (10 * idx)), BYTE_UNITS[idx], suffix)
+    return u"%.1f%s%s" % (num / float(1 << 80), u'Yi', suffix)
 
 
 def reveal(path):
@@ -660,27 +714,21 @@ def copy_path(path, mode=WindowsPath, first=True, copy=True):
         path = get_sequence_endpath(path)
 
     # Normalise path
-    path = re.sub(ur'[\/\\]', ur'/', path,
-                  flags=re.IGNORECASE | re.UNICODE).strip(u'/')
-
-    if mode == WindowsPath:
-        prefix = u'//' if u':' not in path else u''
-    elif mode == UnixPath:
-        prefix = u'//' if u':' not in path else u''
+    path = path.replace(u'\\', u'/').strip(u'/')
+
+    if mode in (WindowsPath, UnixPath):
+        if u':' not in path:
+            path = u'//' + path
+        if mode == WindowsPath:
+            # The path only contains forward slashes at this point
+            path = path.replace(u'/', u'\\')
     elif mode == SlackPath:
-        prefix = u'file://'
+        path = u'file://' + path
     elif mode == MacOSPath:
-        prefix = u'smb://'
-        path = path.replace(u':', u'')
-    else:
-        prefix = u''
-    path = prefix + path
-    if mode == WindowsPath:
-        path = re.sub(ur'[\/\\]', ur'\\', path,
-                      flags=re.IGNORECASE | re.UNICODE)
+        path = u'smb://' + path.replace(u':', u'')
 
     if copy:
-        QtGui.QClipboard().setText(path)
+        QtWidgets.QApplication.clipboard().setText(path)
 
         import bookmarks.log as log
         log.success(u'Copied {}'.format(path))
@@ -715,20 +763,25 @@ def get_ranges(arr, padding):
         unicode: A string representation of the given array.
 
     """
-    arr = sorted(list(set(arr)))
-    blocks = {}
-    k = 0
-    for idx, n in enumerate(arr):  # blocks
-        zfill = unicode(n).zfill(padding)
-
-        if k not in blocks:
-            blocks[k] = []
-        blocks[k].append(zfill)
-
-        if idx + 1 != len(arr):
-            if arr[idx + 1] != n + 1:  # break coming up
-                k += 1
-    return u','.join([u'-'.join(sorted(list(set([blocks[k][0], blocks[k][-1]])))) for k in blocks])
+    if not arr:
+        return u''
+    it = iter(sorted(set(arr)))
+
+    # Only the first and last numbers of each block are formatted
+    blocks = []
+    start = prev = next(it)
+    for n in it:
+        if n != prev + 1:  # break
+            blocks.append((start, prev))
+            start = n
+        prev = n
+    blocks.append((start, prev))
+
+    return u','.join(
+        unicode(a).zfill(padding) if a == b else
+        u'{}-{}'.format(unicode(a).zfill(padding), unicode(b).zfill(padding))
+        for a, b in blocks
+    )
 
 
 def is_valid_filename(text):
@@ -755,6 +808,9 @@ def is_valid_filename(text):
         SRE_Match: A ``SRE_Match`` object if the filename is valid, otherwise ``None``
 
     """
+    # Skip the regex for names without a version token
+    if u'_v' not in text and u'_V' not in text:
+        return None
     return ValidFilenameRegex.search(text)
 
 
@@ -836,6 +892,9 @@ def is_collapsed(s):
     if not isinstance(s, unicode):
         raise ValueError(
             u'Expected <type \'unicode\'>, got {}'.format(type(s)))
+    # Most paths aren't collapsed and can be rejected without the regex
+    if u'[' not in s:
+        return None
     return IsSequenceRegex.search(s)
 
 
@@ -854,13 +913,13 @@ def get_sequence_startpath(path):
         raise ValueError(
             u'Expected <type \'unicode\'>, got {}'.format(type(path)))
 
-    if not is_collapsed(path):
+    if u'[' not in path:
         return path
-
-    match = SequenceStartRegex.search(path)
-    if match:
-        path = SequenceStartRegex.sub(ur'\1\2\3', path)
-    return path
+    # The regex spans the whole path so the groups make up the new path
+    match = SequenceStartRegex.match(path)
+    if not match:
+        return path
+    return match.group(1) + match.group(2) + match.group(3)
 
 
 def get_sequence_endpath(path):
@@ -878,13 +937,13 @@ def get_sequence_endpath(path):
         raise ValueError(
             u'Expected <type \'unicode\'>, got {}'.format(type(path)))
 
-    if not is_collapsed(path):
+    if u'[' not in path:
         return path
-
-    match = SequenceEndRegex.search(path)
-    if match:
-        path = SequenceEndRegex.sub(ur'\1\2\3', path)
-    return path
+    # The regex spans the whole path so the groups make up the new path
+    match = SequenceEndRegex.match(path)
+    if not match:
+        return path
+    return match.group(1) + match.group(2) + match.group(3)
 
 
 def get_sequence_paths(index):
@@ -899,12 +958,17 @@ def get_sequence_paths(index):
     if not is_collapsed(path):
         return path
 
-    sequence_paths = []
-    for frame in index.data(FramesRole):
-        seq = index.data(SequenceRole)
-        seq = seq.group(1) + frame + seq.group(3) + u'.' + seq.group(4)
-        sequence_paths.append(seq)
-    return sequence_paths
+    seq = index.data(SequenceRole)
+    prefix = seq.group(1)
+    suffix = seq.group(3) + u'.' + seq.group(4)
+    return [prefix + frame + suffix for frame in index.data(FramesRole)]
+
+
+METRICS_CACHE = {}
+
+PAINTER_PATH_TEXT = get_platform() == u'win'
+"""Text is only drawn as a *QPainterPath* on Windows, where the aliasing is
+noticeable."""
 
 
 def draw_aliased_text(painter, font, rect, text, align, color):
@@ -912,7 +976,9 @@ def draw_aliased_text(painter, font, rect, text, align, color):
 
     This is a slow to calculate but ensures the rendered text looks *smooth* (on
     Windows espcially, I noticed a lot of aliasing issues). We're also eliding
-    the given text to the width of the given rectangle.
+    the given text to the width of the given rectangle. On other platforms
+    the text is drawn using the painter's glyph cache, see
+    :const:`.PAINTER_PATH_TEXT`.
 
     Args:
         painter (QPainter):         The active painter.
@@ -932,16 +998,20 @@ def draw_aliased_text(painter, font, rect, text, align, color):
     painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
     painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, False)
 
-    elide = None
-    metrics = QtGui.QFontMetrics(font)
+    k = font.key()
+    if k not in METRICS_CACHE:
+        METRICS_CACHE[k] = QtGui.QFontMetrics(font)
+    metrics = METRICS_CACHE[k]
 
-    elide = QtCore.Qt.ElideLeft
-    if QtCore.Qt.AlignLeft & align:
-        elide = QtCore.Qt.ElideRight
-    if QtCore.Qt.AlignRight & align:
-        elide = QtCore.Qt.ElideLeft
+    # The elide mode also tells us how to align the text
     if QtCore.Qt.AlignHCenter & align:
         elide = QtCore.Qt.ElideMiddle
+    elif QtCore.Qt.AlignRight & align:
+        elide = QtCore.Qt.ElideLeft
+    elif QtCore.Qt.AlignLeft & align:
+        elide = QtCore.Qt.ElideRight
+    else:
+        elide = QtCore.Qt.ElideLeft
 
     text = metrics.elidedText(
         u'{}'.format(text),
@@ -949,15 +1019,24 @@ def draw_aliased_text(painter, font, rect, text, align, color):
         rect.width() * 1.01)
     width = metrics.width(text)
 
-    if QtCore.Qt.AlignLeft & align:
+    if elide == QtCore.Qt.ElideRight:
         x = rect.left()
-    if QtCore.Qt.AlignRight & align:
+    elif elide == QtCore.Qt.ElideLeft:
         x = rect.right() - width
-    if QtCore.Qt.AlignHCenter & align:
+    else:
         x = rect.left() + (rect.width() * 0.5) - (width * 0.5)
 
     y = rect.center().y() + (metrics.ascent() * 0.5) - (metrics.descent() * 0.5)
 
+    if not PAINTER_PATH_TEXT:
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing, True)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.setPen(color)
+        painter.setFont(font)
+        painter.drawText(QtCore.QPointF(x, y), text)
+        painter.restore()
+        return width
+
     # Making sure text fits the rectangle
     painter.setBrush(color)
     painter.setPen(QtCore.Qt.NoPen)
@@ -978,46 +1057,50 @@ def walk(path):
     ``DirEntry.relativepath(unicode: basepath)`` method and ``DirEntry.dirpath``
     attribute.
 
+    Subfolders are visited using a stack instead of recursive generators.
+
     Yields:
         DirEntry:   A ctype class.
 
     """
-    try:
-        it = _scandir.scandir(path=path)
-    except OSError:
-        return
-
-    while True:
+    stack = [path, ]
+    while stack:
         try:
+            it = _scandir.scandir(path=stack.pop())
+        except OSError:
+            continue
+
+        while True:
             try:
                 entry = next(it)
-            except StopIteration:
+            except (StopIteration, OSError):
                 break
-        except OSError:
-            return
 
-        try:
-            is_dir = entry.is_dir()
-        except OSError:
-            is_dir = False
-
-        if not is_dir:
+            # Not following symlinks lets scandir answer from the directory
+            # listing without having to stat each entry. Entries we can't
+            # check are treated as files.
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                # Symlinked folders are skipped
+                if entry.is_symlink() and entry.is_dir():
+                    continue
+            except OSError:
+                pass
             yield entry
 
-        try:
-            is_symlink = entry.is_symlink()
-        except OSError:
-            is_symlink = False
-        if not is_symlink:
-            for entry in walk(entry.path):
-                yield entry
+
+RSC_PATH_CACHE = {}
 
 
 def rsc_path(f, n):
     """Helper function to retrieve a resource - file item"""
-    path = u'{}/../rsc/{}.png'.format(f, n)
-    path = os.path.normpath(os.path.abspath(path))
-    return path
+    k = (f, n)
+    if k not in RSC_PATH_CACHE:
+        path = u'{}/../rsc/{}.png'.format(f, n)
+        RSC_PATH_CACHE[k] = os.path.normpath(os.path.abspath(path))
+    return RSC_PATH_CACHE[k]
 
 
 def create_asset_template(source, dest, overwrite=False):
@@ -1031,12 +1114,12 @@ def create_asset_template(source, dest, overwrite=False):
 
     with zipfile.ZipFile(dest, 'w', zipfile.ZIP_DEFLATED) as zipf:
         for root, dirs, files in os.walk(source):
+            # `root` always starts with `source`
+            base = u'.' + root[len(source):]
             for d in dirs:
-                arcname = os.path.join(root, d).replace(source, u'.')
-                zipf.write(os.path.join(root, d), arcname=arcname)
+                zipf.write(os.path.join(root, d), arcname=os.path.join(base, d))
             for f in files:
-                arcname = os.path.join(root, f).replace(source, u'.')
-                zipf.write(os.path.join(root, f), arcname=arcname)
+                zipf.write(os.path.join(root, f), arcname=os.path.join(base, f))
 
 
 def push_to_rv(path):
@@ -1058,8 +1141,7 @@ def push_to_rv(path):
         log.error(u'RV not set')
         return
 
-    rv_info = QtCore.QFileInfo(rv_path)
-    if not rv_info.exists():
+    if not os.path.exists(rv_path):
         common_ui.ErrorBox(
             u'Invalid Shotgun RV path set.',
             u'Make sure the currently set RV path is valid and try again!'
@@ -1068,8 +1150,8 @@ def push_to_rv(path):
         return
 
     if get_platform() == u'win':
-        rv_push_path = u'{}/rvpush.exe'.format(rv_info.path())
-        if QtCore.QFileInfo(rv_push_path).exists():
+        rv_push_path = u'{}/rvpush.exe'.format(os.path.dirname(rv_path))
+        if os.path.exists(rv_push_path):
             cmd = u'"{RV}" -tag {PRODUCT} url \'rvlink:// -reuse 1 -inferSequence -l -play -fps 25 -fullscreen -nofloat -lookback 0 -nomb "{PATH}"\''.format(
                 RV=rv_push_path,
                 PRODUCT=PRODUCT,
@@ -1095,6 +1177,10 @@ PrimaryFontRole = 0
 SecondaryFontRole = PrimaryFontRole + 1
 MetricsRole = SecondaryFontRole + 1
 
+FONT_PATH = os.path.normpath(
+    os.path.abspath(u'{}/../rsc/fonts'.format(__file__)))
+"""The folder containing the custom fonts."""
+
 
 class FontDatabase(QtGui.QFontDatabase):
     """Utility class for loading and getting the application's custom fonts.
@@ -1122,13 +1208,10 @@ class FontDatabase(QtGui.QFontDatabase):
         if u'bmRobotoMedium' in self.families():
             return
 
-        p = u'{}/../rsc/fonts'.format(__file__)
-        p = os.path.normpath(os.path.abspath(p))
+        if not os.path.isdir(FONT_PATH):
+            raise OSError('{} could not be found'.format(FONT_PATH))
 
-        if not os.path.isdir(p):
-            raise OSError('{} could not be found'.format(p))
-
-        for entry in _scandir.scandir(p):
+        for entry in _scandir.scandir(FONT_PATH):
             if not entry.name.endswith(u'ttf'):
                 continue
             idx = self.addApplicationFont(entry.path)
@@ -1168,5 +1251,9 @@ class FontDatabase(QtGui.QFontDatabase):
 
 
 class DataDict(dict):
-    """Subclassed dict type for weakref compatibility."""
-    pass
+    """Subclassed dict type for weakref compatibility.
+
+    Only a weakref slot is declared, items don't carry an instance ``__dict__``.
+
+    """
+    __slots__ = (u'__weakref__',)
@@ -25,6 +25,8 @@ def sort(s):
     return u','.join(sorted(re.findall(r"[\w']+", s)))
 
 
+EXTENSIONS_CACHE = {}
+
 NoFilter = 0
 SceneFilter = 0b10000000
 OpenImageIOFilter = 0b01000000
@@ -324,6 +326,14 @@ def get_extensions(flag):
     return sorted(e)
 
 
+def get_extensions_set(flag):
+    """Get the lowercase extensions of ``flag`` as a cached frozenset."""
+    if flag not in EXTENSIONS_CACHE:
+        EXTENSIONS_CACHE[flag] = frozenset(
+            f.lower() for f in get_extensions(flag))
+    return EXTENSIONS_CACHE[flag]
+
+
 def save_value(data, key, value):
     """Saves the given data/key/value to `local_settings`."""
     idx = None
@@ -346,6 +356,8 @@ def save_value(data, key, value):
     settings.local_settings.setValue(
         u'defaultpaths/{}/{}'.format(idx, key), value)
     data[key][u'value'] = sort(value)
+    if idx == 0:
+        EXTENSIONS_CACHE.clear()
 
 
 load_saved_values()
@@ -59,16 +59,18 @@ class FavouritesModel(FilesModel):
         favourites = settings.local_settings.favourites()
 
         d = []
+        entries = {}  # Favourites often share a folder, we list each only once
 
         for k in favourites:
-            file_info = QtCore.QFileInfo(k)
-            for entry in _scandir.scandir(file_info.path()):
-                path = entry.path.replace(u'\\', u'/').lower()
-                if path == k:
-                    d.append(entry)
-                    continue
-                _k = common.proxy_path(path)
-                if k.lower() == _k.lower():
+            folder = QtCore.QFileInfo(k).path()
+            if folder not in entries:
+                entries[folder] = []
+                for entry in _scandir.scandir(folder):
+                    path = entry.path.replace(u'\\', u'/').lower()
+                    entries[folder].append(
+                        (entry, path, common.proxy_path(path)))
+            for entry, path, _k in entries[folder]:
+                if k == path or k == _k:
                     d.append(entry)
         for entry in d:
             yield entry
@@ -86,14 +88,16 @@ class DropIndicatorWidget(QtWidgets.QWidget):
         self.setAttribute(QtCore.Qt.WA_NoSystemBackground)
         self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
 
+        self._pen = QtGui.QPen(common.FAVOURITE)
+        self._pen.setWidth(common.INDICATOR_WIDTH())
+        self._brush = QtGui.QBrush(common.FAVOURITE)
+
     def paintEvent(self, event):
         """Paints the indicator area."""
         painter = QtGui.QPainter()
         painter.begin(self)
-        pen = QtGui.QPen(common.FAVOURITE)
-        pen.setWidth(common.INDICATOR_WIDTH())
-        painter.setPen(pen)
-        painter.setBrush(common.FAVOURITE)
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush)
         painter.setOpacity(0.35)
         painter.drawRect(self.rect())
         painter.setOpacity(1.0)
@@ -109,7 +113,9 @@ class DropIndicatorWidget(QtWidgets.QWidget):
 
     def show(self):
         """Shows and sets the size of the widget."""
-        self.setGeometry(self.parent().geometry())
+        geometry = self.parent().geometry()
+        if self.geometry() != geometry:
+            self.setGeometry(geometry)
         super(DropIndicatorWidget, self).show()
 
 
@@ -177,19 +183,21 @@ class FavouritesWidget(FilesWidget):
             return
 
         event.accept()
-        favourites = settings.local_settings.favourites()
+        favourites = set(settings.local_settings.favourites())
 
         for url in mime.urls():
-            file_info = QtCore.QFileInfo(url.toLocalFile())
-            path = file_info.filePath().lower()
+            path = QtCore.QFileInfo(url.toLocalFile()).filePath().lower()
 
-            if file_info.suffix().lower() == u'favourites':
+            if path.endswith(u'.favourites'):
+                # The import saves the merged favourites itself
                 common.import_favourites(source=path)
-            else:
-                k = common.proxy_path(path).lower()
-            favourites.append(k)
-        settings.local_settings.setValue(
-            u'favourites', sorted(list(set(favourites))))
+                favourites.update(settings.local_settings.favourites())
+                continue
+            favourites.add(common.proxy_path(path))
+
+        # Only save if we hold keys the saved favourites don't have yet
+        if not favourites.issubset(settings.local_settings.favourites()):
+            settings.local_settings.setValue(u'favourites', sorted(favourites))
         self.favouritesChanged.emit()
 
     def showEvent(self, event):
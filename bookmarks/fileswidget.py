@@ -67,6 +67,12 @@ class FilesModel(baselist.BaseModel):
     val = DEFAULT_ROW_SIZE.height() if val < DEFAULT_ROW_SIZE.height() else val
     ROW_SIZE = QtCore.QSize(1, val)
 
+    DEFAULT_FLAGS = (
+        QtCore.Qt.ItemNeverHasChildren |
+        QtCore.Qt.ItemIsEnabled |
+        QtCore.Qt.ItemIsSelectable)
+    """The default flags to apply to the items."""
+
     queue_type = threads.FileInfoQueue
     thumbnail_queue_type = threads.FileThumbnailQueue
 
@@ -107,16 +113,11 @@ class FilesModel(baselist.BaseModel):
         this is where scandir is evoked.
 
         """
-        def dflags():
-            """The default flags to apply to the item."""
-            return (
-                QtCore.Qt.ItemNeverHasChildren |
-                QtCore.Qt.ItemIsEnabled |
-                QtCore.Qt.ItemIsSelectable)
-
+        dflags = self.DEFAULT_FLAGS
         task_folder = self.task_folder().lower()
 
         SEQUENCE_DATA = common.DataDict()
+        NONSEQUENCE_ITEMS = []  # Shared by the file and sequence data as-is
         MODEL_DATA = common.DataDict({
             common.FileItem: common.DataDict(),
             common.SequenceItem: common.DataDict(),
@@ -126,6 +127,20 @@ class FilesModel(baselist.BaseModel):
         sfavourites = set(favourites)
         activefile = settings.local_settings.value(u'activepath/file')
 
+        # The values all new items start with, copied into each item
+        prototype = {
+            QtCore.Qt.SizeHintRole: self.ROW_SIZE,
+            common.DescriptionRole: u'',
+            common.TodoCountRole: 0,
+            common.FileDetailsRole: u'',
+            common.FileInfoLoaded: False,
+            common.StartpathRole: None,
+            common.EndpathRole: None,
+            common.ThumbnailLoaded: False,
+            common.SortByLastModifiedRole: 0,
+            common.SortBySizeRole: 0,
+        }
+
         server, job, root, asset = self.parent_path
         task_folder_extensions = defaultpaths.get_task_folder_extensions(
             task_folder)
@@ -138,6 +153,11 @@ class FilesModel(baselist.BaseModel):
         if not QtCore.QFileInfo(parent_path).exists():
             return
 
+        # Local names for the lookups repeated for every file
+        FILE_DATA = MODEL_DATA[common.FileItem]
+        get_sequence = common.get_sequence
+        namekey = common.namekey
+
         for entry in self._entry_iterator(parent_path):
             if self._interrupt_requested:
                 break
@@ -152,12 +172,12 @@ class FilesModel(baselist.BaseModel):
             if u'thumbs.db' in filename:
                 continue
 
-            filepath = entry.path.lower().replace(u'\\', u'/')
-            ext = filename.split(u'.')[-1]
-
-            if task_folder_extensions and ext not in task_folder_extensions:
+            if task_folder_extensions and \
+                    filename.rpartition(u'.')[2] not in task_folder_extensions:
                 continue
 
+            filepath = entry.path.lower().replace(u'\\', u'/')
+
             # Progress bar
             c += 1
             if not c % nth:
@@ -167,15 +187,15 @@ class FilesModel(baselist.BaseModel):
 
             # Getting the fileroot
             fileroot = filepath.replace(parent_path, u'')
-            fileroot = u'/'.join(fileroot.split(u'/')[:-1]).strip(u'/')
-            seq = common.get_sequence(filepath)
+            fileroot = fileroot.rpartition(u'/')[0].strip(u'/')
+            seq = get_sequence(filepath)
 
-            flags = dflags()
+            flags = dflags
 
             if seq:
+                # `filepath` is lowercase already, and so are its groups
                 seqpath = seq.group(1) + common.SEQPROXY + \
                     seq.group(3) + u'.' + seq.group(4)
-                seqpath = seqpath.lower()
                 if seqpath in sfavourites:
                     flags = flags | common.MarkedAsFavourite
             else:
@@ -190,38 +210,29 @@ class FilesModel(baselist.BaseModel):
                                 task_folder, fileroot)
 
             # Let's limit the maximum number of items we load
-            idx = len(MODEL_DATA[common.FileItem])
+            idx = len(FILE_DATA)
             if idx >= common.MAXITEMS:
                 break
 
-            MODEL_DATA[common.FileItem][idx] = common.DataDict({
+            item = common.DataDict(prototype)
+            item.update({
                 QtCore.Qt.DisplayRole: filename,
                 QtCore.Qt.EditRole: filename,
                 QtCore.Qt.StatusTipRole: filepath,
-                QtCore.Qt.SizeHintRole: self.ROW_SIZE,
                 #
                 common.EntryRole: [entry, ],
                 common.FlagsRole: flags,
                 common.ParentPathRole: parent_path_role,
-                common.DescriptionRole: u'',
-                common.TodoCountRole: 0,
-                common.FileDetailsRole: u'',
                 common.SequenceRole: seq,
                 common.FramesRole: [],
-                common.FileInfoLoaded: False,
-                common.StartpathRole: None,
-                common.EndpathRole: None,
-                #
-                common.ThumbnailLoaded: False,
                 #
                 common.TypeRole: common.FileItem,
                 #
-                common.SortByNameRole: common.namekey(filepath),
-                common.SortByLastModifiedRole: 0,
-                common.SortBySizeRole: 0,
+                common.SortByNameRole: namekey(filepath),
                 #
                 common.IdRole: idx  # non-mutable
             })
+            FILE_DATA[idx] = item
 
             # If the file in question is a sequence, we will also save a reference
             # to it in `self._model_data[location][True]` dictionary.
@@ -229,62 +240,54 @@ class FilesModel(baselist.BaseModel):
                 # If the sequence has not yet been added to our dictionary
                 # of seqeunces we add it here
                 if seqpath not in SEQUENCE_DATA:  # ... and create it if it doesn't exist
-                    seqname = seqpath.split(u'/')[-1]
-                    flags = dflags()
+                    seqname = seqpath.rpartition(u'/')[2]
+                    flags = dflags
 
                     if seqpath in sfavourites:
                         flags = flags | common.MarkedAsFavourite
 
-                    SEQUENCE_DATA[seqpath] = common.DataDict({
+                    item = common.DataDict(prototype)
+                    item.update({
                         QtCore.Qt.DisplayRole: seqname,
                         QtCore.Qt.EditRole: seqname,
                         QtCore.Qt.StatusTipRole: seqpath,
-                        QtCore.Qt.SizeHintRole: self.ROW_SIZE,
                         common.EntryRole: [],
                         common.FlagsRole: flags,
                         common.ParentPathRole: parent_path_role,
-                        common.DescriptionRole: u'',
-                        common.TodoCountRole: 0,
-                        common.FileDetailsRole: u'',
                         common.SequenceRole: seq,
                         common.FramesRole: [],
-                        common.FileInfoLoaded: False,
-                        common.StartpathRole: None,
-                        common.EndpathRole: None,
-                        #
-                        common.ThumbnailLoaded: False,
                         #
                         common.TypeRole: common.SequenceItem,
-                        common.SortByNameRole: common.namekey(seqpath),
-                        common.SortByLastModifiedRole: 0,
-                        common.SortBySizeRole: 0,  # Initializing with null-size
+                        common.SortByNameRole: namekey(seqpath),
                         #
                         common.IdRole: 0
                     })
+                    SEQUENCE_DATA[seqpath] = item
 
                 SEQUENCE_DATA[seqpath][common.FramesRole].append(seq.group(2))
                 SEQUENCE_DATA[seqpath][common.EntryRole].append(entry)
             else:
-                SEQUENCE_DATA[filepath] = MODEL_DATA[common.FileItem][idx]
+                NONSEQUENCE_ITEMS.append(item)
 
         # Casting the sequence data back onto the model
-        for v in SEQUENCE_DATA.itervalues():
-            idx = len(MODEL_DATA[common.SequenceItem])
-            if len(v[common.FramesRole]) == 1:
+        sequence_data = MODEL_DATA[common.SequenceItem]
+        for idx, v in enumerate(SEQUENCE_DATA.itervalues()):
+            frames = v[common.FramesRole]
+            if len(frames) == 1:
                 # A sequence with only one element is not a sequence
                 _seq = v[common.SequenceRole]
                 filepath = _seq.group(
-                    1) + v[common.FramesRole][0] + _seq.group(3) + u'.' + _seq.group(4)
-                filename = filepath.split(u'/')[-1]
+                    1) + frames[0] + _seq.group(3) + u'.' + _seq.group(4)
+                filename = filepath.rpartition(u'/')[2]
                 v[QtCore.Qt.DisplayRole] = filename
                 v[QtCore.Qt.EditRole] = filename
                 v[QtCore.Qt.StatusTipRole] = filepath
                 v[common.TypeRole] = common.FileItem
-                v[common.SortByNameRole] = common.namekey(filepath)
+                v[common.SortByNameRole] = namekey(filepath)
                 v[common.SortByLastModifiedRole] = 0
 
-                flags = dflags()
-                if filepath.lower() in sfavourites:
+                flags = dflags
+                if filepath in sfavourites:
                     flags = flags | common.MarkedAsFavourite
 
                 if activefile:
@@ -293,17 +296,20 @@ class FilesModel(baselist.BaseModel):
 
                 v[common.FlagsRole] = flags
 
-            elif len(v[common.FramesRole]) == 0:
-                v[common.TypeRole] = common.FileItem
             else:
                 if activefile:
                     _seq = v[common.SequenceRole]
                     _firsframe = _seq.group(
-                        1) + min(v[common.FramesRole]) + _seq.group(3) + u'.' + _seq.group(4)
+                        1) + min(frames) + _seq.group(3) + u'.' + _seq.group(4)
                     if activefile in _firsframe:
                         v[common.FlagsRole] = v[common.FlagsRole] | common.MarkedAsActive
-            MODEL_DATA[common.SequenceItem][idx] = v
-            MODEL_DATA[common.SequenceItem][idx][common.IdRole] = idx
+            v[common.IdRole] = idx
+            sequence_data[idx] = v
+
+        for v in NONSEQUENCE_ITEMS:
+            idx = len(sequence_data)
+            v[common.IdRole] = idx
+            sequence_data[idx] = v
 
         self.INTERNAL_MODEL_DATA[task_folder] = MODEL_DATA
 
@@ -427,26 +433,17 @@ class FilesModel(baselist.BaseModel):
             necessary, but on MacOS a simple uri list seem to suffice.
 
         """
-        def add_path_to_mime(mime, path):
-            """Adds the given path to the mime data."""
+        def add_path_to_mime(file_paths, path):
+            """Adds the given path to the list of file paths."""
             if not isinstance(path, unicode):
                 s = u'Expected <type \'unicode\'>, got {}'.format(type(str))
                 log.error(s)
                 raise TypeError(s)
 
-            path = QtCore.QFileInfo(path).absoluteFilePath()
-            mime.setUrls(mime.urls() + [QtCore.QUrl.fromLocalFile(path), ])
-
-            path = QtCore.QDir.toNativeSeparators(path).encode('utf-8')
-            _bytes = QtCore.QByteArray(path)
-            mime.setData(
-                u'application/x-qt-windows-mime;value="FileName"', _bytes)
-            mime.setData(
-                u'application/x-qt-windows-mime;value="FileNameW"', _bytes)
-
-            return mime
+            file_paths.append(QtCore.QFileInfo(path).absoluteFilePath())
 
         mime = QtCore.QMimeData()
+        file_paths = []
         modifiers = QtWidgets.QApplication.instance().keyboardModifiers()
         no_modifier = modifiers == QtCore.Qt.NoModifier
         alt_modifier = modifiers & QtCore.Qt.AltModifier
@@ -459,17 +456,29 @@ class FilesModel(baselist.BaseModel):
 
             if no_modifier:
                 path = common.get_sequence_endpath(path)
-                add_path_to_mime(mime, path)
+                add_path_to_mime(file_paths, path)
             elif alt_modifier and shift_modifier:
-                path = QtCore.QFileInfo(path).dir().path()
-                add_path_to_mime(mime, path)
+                path = QtCore.QFileInfo(path).path()
+                add_path_to_mime(file_paths, path)
             elif alt_modifier:
                 path = common.get_sequence_startpath(path)
-                add_path_to_mime(mime, path)
+                add_path_to_mime(file_paths, path)
             elif shift_modifier:
                 paths = common.get_sequence_paths(index)
                 for path in paths:
-                    add_path_to_mime(mime, path)
+                    add_path_to_mime(file_paths, path)
+
+        if not file_paths:
+            return mime
+
+        # The urls are set in one go, the windows types hold the last path only
+        mime.setUrls([QtCore.QUrl.fromLocalFile(f) for f in file_paths])
+        path = QtCore.QDir.toNativeSeparators(file_paths[-1])
+        _bytes = QtCore.QByteArray(path.encode('utf-8'))
+        mime.setData(
+            u'application/x-qt-windows-mime;value="FileName"', _bytes)
+        mime.setData(
+            u'application/x-qt-windows-mime;value="FileNameW"', _bytes)
         return mime
 
 
@@ -687,7 +696,7 @@ class FilesWidget(baselist.ThreadedBaseWidget):
         elif alt_modifier and shift_modifier:
             pixmap = images.ImageCache.get_rsc_pixmap(
                 u'folder', common.SECONDARY_TEXT, height)
-            path = QtCore.QFileInfo(path).dir().path()
+            path = QtCore.QFileInfo(path).path()
         elif alt_modifier:
             pixmap = images.ImageCache.get_rsc_pixmap(
                 u'files', common.SECONDARY_TEXT, height)
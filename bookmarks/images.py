@@ -16,6 +16,7 @@ import uuid
 import os
 import functools
 import numpy as np
+import psutil
 import OpenImageIO
 
 from PySide2 import QtWidgets, QtGui, QtCore
@@ -26,8 +27,12 @@ import bookmarks._scandir as _scandir
 import bookmarks.defaultpaths as defaultpaths
 
 
+# Let's use a quarter of the system memory for caching, but no more than 4GB
+OIIO_CACHE_MEMORY = min(
+    4096.0, psutil.virtual_memory().total / (1024.0 * 1024.0) * 0.25)
+
 oiio_cache = OpenImageIO.ImageCache(shared=True)
-oiio_cache.attribute(u'max_memory_MB', 4096.0)
+oiio_cache.attribute(u'max_memory_MB', OIIO_CACHE_MEMORY)
 oiio_cache.attribute(u'max_open_files', 100)
 oiio_cache.attribute(u'trust_file_extensions', 1)
 
@@ -84,7 +89,7 @@ def set_from_source(index, source):
 
     ImageCache.flush(destination)
     ImageCache.get_image(destination, size)
-    ImageCache.make_color(destination)
+    ImageCache.make_color(destination, size)
 
     if hasattr(index.model(), 'updateIndex'):
         index.model().updateIndex.emit(index)
@@ -193,7 +198,7 @@ def get_thumbnail_path(server, job, root, file_path, proxy=False):
         unicode:                The resolved thumbnail path.
 
     """
-    if common.is_collapsed(file_path) or proxy:
+    if proxy or common.is_collapsed(file_path):
         file_path = common.proxy_path(file_path)
     name = common.get_hash(file_path) + u'.' + common.THUMBNAIL_FORMAT
     return (server + u'/' + job + u'/' + root + u'/.bookmark/' + name).lower()
@@ -218,15 +223,13 @@ def get_placeholder_path(file_path, fallback=None):
 
     file_info = QtCore.QFileInfo(file_path)
     suffix = file_info.suffix().lower()
-    if suffix:
-        for ext in defaultpaths.get_extensions(
-            defaultpaths.SceneFilter |
-            defaultpaths.ExportFilter |
-            defaultpaths.MiscFilter |
-            defaultpaths.AdobeFilter
-        ):
-            if ext.lower() == suffix:
-                return common.rsc_path(__file__, ext)
+    if suffix and suffix in defaultpaths.get_extensions_set(
+        defaultpaths.SceneFilter |
+        defaultpaths.ExportFilter |
+        defaultpaths.MiscFilter |
+        defaultpaths.AdobeFilter
+    ):
+        return common.rsc_path(__file__, suffix)
     if not fallback:
         fallback = u'placeholder'
     return common.rsc_path(__file__, fallback)
@@ -250,8 +253,10 @@ def oiio_get_buf(source, hash=None, force=False):
     if hash is None:
         hash = common.get_hash(source)
 
-    if not force and ImageCache.contains(hash, BufferType):
-        return ImageCache.value(hash, BufferType)
+    if not force:
+        buf = ImageCache.value(hash, BufferType)
+        if buf is not None:
+            return buf
 
     # We use the extension to initiate an ImageInput with a format
     # which in turn is used to check the source's validity
@@ -376,6 +381,19 @@ class ImageCache(QtCore.QObject):
         ResourcePixmapType: common.DataDict(),
         ColorType: common.DataDict(),
     })
+    CACHE_LIMITS = {
+        BufferType: 256,
+        PixmapType: 4096,
+        ImageType: 4096,
+    }
+    """The maximum number of sources kept by the bounded caches.
+
+    The caches are shared with the worker threads, so a full cache makes room
+    with the atomic ``dict.popitem()`` instead of tracking the least recently
+    used source. The evicted source is arbitrary and can be a visible
+    thumbnail, in which case it's reloaded from disk when next requested.
+
+    """
 
     @classmethod
     def contains(cls, hash, cache_type):
@@ -390,13 +408,13 @@ class ImageCache(QtCore.QObject):
             hash (str): A hash value generated by `common.get_hash`
 
         """
-        if not cls.contains(hash, cache_type):
+        # Other threads might evict items at any time so we use a single lookup
+        data = cls.INTERNAL_DATA[cache_type].get(hash)
+        if data is None:
             return None
         if size is not None:
-            if size not in cls.INTERNAL_DATA[cache_type][hash]:
-                return None
-            return cls.INTERNAL_DATA[cache_type][hash][size]
-        return cls.INTERNAL_DATA[cache_type][hash]
+            return data.get(size)
+        return data
 
     @classmethod
     def setValue(cls, hash, value, cache_type, size=None):
@@ -406,16 +424,25 @@ class ImageCache(QtCore.QObject):
         setting the new value. This only applies to Image- and PixmapTypes.
 
         """
-        if not cls.contains(hash, cache_type):
-            cls.INTERNAL_DATA[cache_type][hash] = common.DataDict()
+        data = cls.INTERNAL_DATA[cache_type]
+
+        # Other threads might evict items at any time, so we keep hold of the
+        # per-source dict instead of looking it up again
+        d = data.get(hash)
+        if d is None and cache_type in cls.CACHE_LIMITS:
+            if len(data) >= cls.CACHE_LIMITS[cache_type]:
+                try:
+                    data.popitem()
+                except KeyError:
+                    pass
 
         if cache_type == BufferType:
             if not isinstance(value, OpenImageIO.ImageBuf):
                 raise TypeError(
                     u'Invalid type. Expected <type \'ImageBuf\'>, got {}'.format(type(value)))
 
-            cls.INTERNAL_DATA[BufferType][hash] = value
-            return cls.INTERNAL_DATA[BufferType][hash]
+            data[hash] = value
+            return value
 
         elif cache_type == ImageType:
             if not isinstance(value, QtGui.QImage):
@@ -427,8 +454,11 @@ class ImageCache(QtCore.QObject):
             if not isinstance(size, int):
                 size = int(size)
 
-            cls.INTERNAL_DATA[cache_type][hash][size] = value
-            return cls.INTERNAL_DATA[cache_type][hash][size]
+            if d is None:
+                d = common.DataDict()
+                data[hash] = d
+            d[size] = value
+            return value
 
         elif cache_type == PixmapType or cache_type == ResourcePixmapType:
             if not isinstance(value, QtGui.QPixmap):
@@ -438,16 +468,19 @@ class ImageCache(QtCore.QObject):
             if not isinstance(size, int):
                 size = int(size)
 
-            cls.INTERNAL_DATA[cache_type][hash][size] = value
-            return cls.INTERNAL_DATA[cache_type][hash][size]
+            if d is None:
+                d = common.DataDict()
+                data[hash] = d
+            d[size] = value
+            return value
 
         elif cache_type == ColorType:
             if not isinstance(value, QtGui.QColor):
                 raise TypeError(
                     u'Invalid type. Expected <type \'QColor\'>, got {}'.format(type(value)))
 
-            cls.INTERNAL_DATA[ColorType][hash] = value
-            return cls.INTERNAL_DATA[ColorType][hash]
+            data[hash] = value
+            return value
         else:
             raise TypeError('Invalid cache type.')
 
@@ -455,8 +488,7 @@ class ImageCache(QtCore.QObject):
     def flush(cls, source):
         hash = common.get_hash(source)
         for k in cls.INTERNAL_DATA:
-            if hash in cls.INTERNAL_DATA[k]:
-                del cls.INTERNAL_DATA[k][hash]
+            cls.INTERNAL_DATA[k].pop(hash, None)
 
     @classmethod
     def get_pixmap(cls, source, size, hash=None, force=False):
@@ -536,13 +568,34 @@ class ImageCache(QtCore.QObject):
         return None
 
     @classmethod
-    def make_color(cls, source):
+    def make_color(cls, source, size=None):
+        """Makes and caches the average colour of `source`.
+
+        Args:
+            source (unicode): Path to an OpenImageIO compliant image file.
+            size (int): The size of a just loaded copy of `source` in the
+                cache. Averaging it is much cheaper than reading the pixel
+                statistics of the whole file. Defaults to `None`.
+
+        """
+        hash = common.get_hash(source)
+
+        if size is not None:
+            image = cls.value(hash, ImageType, size=int(size))
+            if image is not None and not image.isNull():
+                color = image.scaled(
+                    1, 1,
+                    QtCore.Qt.IgnoreAspectRatio,
+                    QtCore.Qt.SmoothTransformation
+                ).pixelColor(0, 0)
+                color.setAlpha(240 if image.hasAlphaChannel() else 255)
+                cls.setValue(hash, color, ColorType)
+                return color
+
         buf = oiio_get_buf(source)
         if not buf:
             return None
 
-        hash = common.get_hash(source)
-
         stats = OpenImageIO.ImageBufAlgo.computePixelStats(buf)
         if not stats:
             return None
@@ -608,11 +661,9 @@ class ImageCache(QtCore.QObject):
             if data:
                 return data
 
-        # If not yet stored, load and save the data
-        buf = oiio_get_buf(source, hash=hash, force=force)
-        if not buf:
-            return None
-
+        # If not yet stored, load and save the data. Qt's image readers will
+        # reject anything they can't decode so there's no need to probe the
+        # file with OpenImageIO first
         image = QtGui.QImage(source)
         if image.isNull():
             return None
@@ -646,7 +697,13 @@ class ImageCache(QtCore.QObject):
 
         w = image.width()
         h = image.height()
-        factor = float(size) / max(float(w), float(h))
+
+        # Thumbnails are often already saved at the requested size
+        longest = max(w, h)
+        if longest == int(size):
+            return image
+
+        factor = float(size) / float(longest)
         w *= factor
         h *= factor
 
@@ -666,10 +723,9 @@ class ImageCache(QtCore.QObject):
 
         """
         source = u'{}/../rsc/{}.png'.format(__file__, name)
-        file_info = QtCore.QFileInfo(source)
 
         if get_path:
-            return file_info.absoluteFilePath()
+            return QtCore.QFileInfo(source).absoluteFilePath()
 
         k = u'rsc:{name}:{size}:{color}'.format(
             name=name.lower(),
@@ -680,11 +736,22 @@ class ImageCache(QtCore.QObject):
         if k in cls.RESOURCE_DATA:
             return cls.RESOURCE_DATA[k]
 
+        file_info = QtCore.QFileInfo(source)
         if not file_info.exists():
             return QtGui.QPixmap()
 
-        image = QtGui.QImage()
-        image.load(file_info.filePath())
+        # We'll let the reader decode the image at the requested size
+        reader = QtGui.QImageReader(file_info.filePath())
+        source_size = reader.size()
+        scaled = source_size.isValid() and not source_size.isEmpty()
+        if scaled:
+            factor = float(size) / max(
+                float(source_size.width()), float(source_size.height()))
+            reader.setScaledSize(QtCore.QSize(
+                int(source_size.width() * factor),
+                int(source_size.height() * factor)
+            ))
+        image = reader.read()
         if image.isNull():
             return QtGui.QPixmap()
 
@@ -699,7 +766,8 @@ class ImageCache(QtCore.QObject):
             painter.drawRect(image.rect())
             painter.end()
 
-        image = cls.resize_image(image, size)
+        if not scaled:
+            image = cls.resize_image(image, size)
 
         # Setting transparency
         if opacity < 1.0:
@@ -735,6 +803,11 @@ class ImageCache(QtCore.QObject):
         """
         log.debug(u'Converting {}...'.format(source), cls)
 
+        # No point in reading the source if we can't save the result
+        if not QtCore.QFileInfo(QtCore.QFileInfo(destination).path()).isWritable():
+            log.error(u'Destination path is not writable')
+            return False
+
         def get_scaled_spec(source_spec):
             w = source_spec.width
             h = source_spec.height
@@ -847,12 +920,6 @@ class ImageCache(QtCore.QObject):
         _buf.copy_pixels(buf)
         _buf.set_write_format(OpenImageIO.UINT8)
 
-        if not QtCore.QFileInfo(QtCore.QFileInfo(destination).path()).isWritable():
-            oiio_cache.invalidate(source, force=True)
-            oiio_cache.invalidate(destination, force=True)
-            log.error(u'Destination path is not writable')
-            return False
-
         success = _buf.write(destination, dtype=OpenImageIO.UINT8)
 
         if not success:
@@ -1201,7 +1268,7 @@ class Viewer(QtWidgets.QGraphicsView):
 
         # Image info
         ext = QtCore.QFileInfo(index.data(QtCore.Qt.StatusTipRole)).suffix()
-        if ext.lower() in defaultpaths.get_extensions(defaultpaths.OpenImageIOFilter):
+        if ext.lower() in defaultpaths.get_extensions_set(defaultpaths.OpenImageIOFilter):
             font, metrics = common.font_db.secondary_font(
                 common.SMALL_FONT_SIZE())
 
@@ -829,11 +829,13 @@ class SlackDropOverlayWidget(QtWidgets.QWidget):
         widget.message_widget.append_message(message)
 
     def showEvent(self, event):
-        pos = self.parent().rect().topLeft()
-        pos = self.parent().mapToGlobal(pos)
-        self.move(pos)
-        self.setFixedWidth(self.parent().rect().width())
-        self.setFixedHeight(self.parent().rect().height())
+        parent = self.parent()
+        if not parent:
+            return
+        rect = parent.rect()
+        self.move(parent.mapToGlobal(rect.topLeft()))
+        self.setFixedWidth(rect.width())
+        self.setFixedHeight(rect.height())
 
 
 class ListControlWidget(QtWidgets.QWidget):
@@ -920,8 +922,8 @@ class ListControlWidget(QtWidgets.QWidget):
 
     @QtCore.Slot(QtCore.QModelIndex)
     def signal_dispatcher(self, index):
+        # `textChanged` is forwarded from the files model's `taskFolderChanged`
         self.taskFolderChanged.emit(index.data(QtCore.Qt.DisplayRole))
-        self.textChanged.emit(index.data(QtCore.Qt.DisplayRole))
         self.listChanged.emit(2)
 
     def _connect_signals(self):
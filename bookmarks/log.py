@@ -9,7 +9,8 @@ automatically enabled when the widget is visible.
 import re
 import time
 import traceback
-import cStringIO
+import itertools
+import collections
 
 from PySide2 import QtGui, QtCore, QtWidgets
 
@@ -18,8 +19,14 @@ import bookmarks.common as common
 
 mutex = QtCore.QMutex()
 
-stdout = cStringIO.StringIO()
-"""File-like object to store our temporary log."""
+MAX_ENTRIES = 2000
+"""The maximum number of log entries to keep."""
+
+stdout = collections.deque([], maxlen=MAX_ENTRIES)
+"""Stores the most recent entries of our temporary log."""
+
+count = 0
+"""The number of entries logged since the last reset."""
 
 _viewer_widget = None
 
@@ -33,6 +40,9 @@ ENDC = (0b001000000, u'\033[0m')
 BOLD = (0b010000000, u'\033[1m')
 UNDERLINE = (0b100000000, u'\033[4m')
 
+FORMAT_REGEX = re.compile(ur'\x1b\[[0-9;]*m')
+"""Matches any of the console (SGR) escape sequences used above."""
+
 LOGGING_ON = False
 LOG_SUCCESS = True
 LOG_DEBUG = False
@@ -40,8 +50,10 @@ LOG_ERROR = True
 
 
 def _log(message):
+    global count
     mutex.lock()
-    print >> stdout, message
+    stdout.append(message)
+    count += 1
     print message
     mutex.unlock()
 
@@ -112,7 +124,11 @@ def error(message):
 @QtCore.Slot()
 def reset(self):
     global stdout
-    stdout = cStringIO.StringIO()
+    global count
+    mutex.lock()
+    stdout = collections.deque([], maxlen=MAX_ENTRIES)
+    count = 0
+    mutex.unlock()
 
 
 def _r(v): return v[1].replace(u'[', u'\\[')
@@ -123,137 +139,87 @@ class LogViewHighlighter(QtGui.QSyntaxHighlighter):
     Applies the console color output syntax.
 
     """
-    _f = re.IGNORECASE | re.UNICODE
-    HIGHLIGHT_RULES = {
-        OKBLUE[0]: re.compile(u'{}(.+?)(?:{})(.+)'.format(_r(OKBLUE), _r(ENDC)), flags=_f),
-        OKGREEN[0]: re.compile(u'{}(.+?)(?:{})(.+)'.format(_r(OKGREEN), _r(ENDC)), flags=_f),
-        FAIL[0]: re.compile(u'{}{}(.+?)(?:{})(.+)'.format(_r(FAIL), _r(UNDERLINE), _r(ENDC)), flags=_f),
-        FAIL_SUB[0]: re.compile(u'{}(.*)'.format(_r(FAIL)), flags=_f),
-    }
+    HIGHLIGHT_REGEX = re.compile(
+        u'|'.join((
+            u'(?P<OKBLUE>{}(.+?)(?:{})(.+))'.format(_r(OKBLUE), _r(ENDC)),
+            u'(?P<OKGREEN>{}(.+?)(?:{})(.+))'.format(_r(OKGREEN), _r(ENDC)),
+            u'(?P<FAIL>^{}{}(.+?)(?:{})(.+))'.format(
+                _r(FAIL), _r(UNDERLINE), _r(ENDC)),
+            u'(?P<FAIL_SUB>{}(.*))'.format(_r(FAIL)),
+        )),
+        flags=re.IGNORECASE | re.UNICODE
+    )
+
+    def __init__(self, parent=None):
+        super(LogViewHighlighter, self).__init__(parent)
 
-    def highlightBlock(self, text):
         font = QtGui.QFont()
         font.setStyleHint(QtGui.QFont.System)
 
-        char_format = QtGui.QTextCharFormat()
-        char_format.setFont(font)
-        char_format.setForeground(QtGui.QColor(0, 0, 0, 0))
+        self.default_format = QtGui.QTextCharFormat()
+        self.default_format.setFont(font)
+        self.default_format.setForeground(QtGui.QColor(0, 0, 0, 0))
 
-        block_format = QtGui.QTextBlockFormat()
-        block_format.setLineHeight(
+        self.block_format = QtGui.QTextBlockFormat()
+        self.block_format.setLineHeight(
             150, QtGui.QTextBlockFormat.ProportionalHeight)
-        self.setFormat(0, len(text), char_format)
 
-        _font = char_format.font()
-        _foreground = char_format.foreground()
-        _weight = char_format.fontWeight()
-        _psize = char_format.font().pixelSize()
+        font.setPixelSize(common.MEDIUM_FONT_SIZE())
+
+        def _format(color, underline=False):
+            char_format = QtGui.QTextCharFormat()
+            char_format.setFont(font)
+            char_format.setForeground(color)
+            char_format.setFontUnderline(underline)
+            return char_format
+
+        text = QtGui.QColor(157, 165, 180, 255)
+        red = QtGui.QColor(230, 80, 80, 255)
+
+        # The formats applied to each of the groups of a matching rule
+        self.formats = {
+            u'OKBLUE': (
+                _format(QtGui.QColor(85, 85, 255, 255)),
+                _format(text),
+            ),
+            u'OKGREEN': (
+                _format(QtGui.QColor(80, 230, 80, 255)),
+                _format(text),
+            ),
+            u'FAIL': (
+                _format(red, underline=True),
+                _format(text, underline=True),
+            ),
+            u'FAIL_SUB': (
+                _format(red),
+            ),
+        }
 
-        flag = 0
+    def highlightBlock(self, text):
+        self.setFormat(0, len(text), self.default_format)
+
+        # Every rule starts with an escape sequence
+        if u'\x1b' not in text:
+            return
 
         position = self.currentBlock().position()
         cursor = QtGui.QTextCursor(self.currentBlock())
-        cursor.mergeBlockFormat(block_format)
-        cursor = QtGui.QTextCursor(self.document())
 
-        for k in self.HIGHLIGHT_RULES:
-            if k == OKGREEN[0]:
-                it = self.HIGHLIGHT_RULES[k].finditer(text)
-                for match in it:
-                    flag = flag | k
-                    font.setPixelSize(common.MEDIUM_FONT_SIZE())
-                    char_format.setFont(font)
-
-                    char_format.setForeground(QtGui.QColor(80, 230, 80, 255))
-
-                    self.setFormat(match.start(1), len(
-                        match.group(1)), char_format)
-                    cursor = self.document().find(match.group(1), position)
-                    cursor.mergeCharFormat(char_format)
-
-                    char_format.setForeground(QtGui.QColor(157, 165, 180, 255))
-
-                    self.setFormat(match.start(2), len(
-                        match.group(2)), char_format)
-                    cursor = self.document().find(match.group(2), position)
-                    cursor.mergeCharFormat(char_format)
-
-            if k == OKBLUE[0]:
-                it = self.HIGHLIGHT_RULES[k].finditer(text)
-                for match in it:
-                    flag = flag | k
-                    font.setPixelSize(common.MEDIUM_FONT_SIZE())
-                    char_format.setFont(font)
-                    char_format.setForeground(QtGui.QColor(85, 85, 255, 255))
-
-                    self.setFormat(match.start(1), len(
-                        match.group(1)), char_format)
-                    cursor = self.document().find(match.group(1), position)
-                    cursor.mergeCharFormat(char_format)
-
-                    char_format.setForeground(QtGui.QColor(157, 165, 180, 255))
-
-                    self.setFormat(match.start(2), len(
-                        match.group(2)), char_format)
-                    cursor = self.document().find(match.group(2), position)
-                    cursor.mergeCharFormat(char_format)
-
-            if k == FAIL[0]:
-                match = self.HIGHLIGHT_RULES[k].match(text)
-                if match:
-                    flag = flag | k
-                    font.setPixelSize(common.MEDIUM_FONT_SIZE())
-                    char_format.setFont(font)
-                    char_format.setForeground(QtGui.QColor(230, 80, 80, 255))
-                    char_format.setFontUnderline(True)
-
-                    self.setFormat(match.start(1), len(
-                        match.group(1)), char_format)
-                    cursor = self.document().find(match.group(1), position)
-                    cursor.mergeCharFormat(char_format)
-
-                    char_format.setForeground(QtGui.QColor(157, 165, 180, 255))
-
-                    self.setFormat(match.start(2), len(
-                        match.group(2)), char_format)
-                    cursor = self.document().find(match.group(2), position)
-                    cursor.mergeCharFormat(char_format)
-
-            if k == FAIL_SUB[0]:
-                # continue
-                it = self.HIGHLIGHT_RULES[k].finditer(text)
-                for match in it:
-                    if flag & FAIL[0]:
-                        continue
-                    char_format.setFontUnderline(False)
-                    font.setPixelSize(common.MEDIUM_FONT_SIZE())
-                    char_format.setFont(font)
-                    char_format.setForeground(QtGui.QColor(230, 80, 80, 255))
-
-                    self.setFormat(match.start(1), len(
-                        match.group(1)), char_format)
-                    cursor = self.document().find(match.group(1), position)
-                    cursor.mergeCharFormat(char_format)
-
-            char_format.setFont(_font)
-            char_format.setForeground(_foreground)
-            char_format.setFontWeight(_weight)
+        for match in self.HIGHLIGHT_REGEX.finditer(text):
+            idx = self.HIGHLIGHT_REGEX.groupindex[match.lastgroup]
+            for n, char_format in enumerate(self.formats[match.lastgroup], 1):
+                start, end = match.span(idx + n)
+                self.setFormat(start, end - start, char_format)
 
+                # The format has to be merged into the document too, otherwise
+                # it would be lost when the escape sequences are stripped
+                cursor.setPosition(position + start)
+                cursor.setPosition(
+                    position + end, QtGui.QTextCursor.KeepAnchor)
+                cursor.mergeCharFormat(char_format)
 
-class LogView(QtWidgets.QTextBrowser):
 
-    format_regex = u'({h})|({b})|({g})|({w})|({f})|({e})|({o})|({u})'
-    format_regex = format_regex.format(
-        h=HEADER[1],
-        b=OKBLUE[1],
-        g=OKGREEN[1],
-        w=WARNING[1],
-        f=FAIL[1],
-        e=ENDC[1],
-        o=BOLD[1],
-        u=UNDERLINE[1],
-    )
-    format_regex = re.compile(format_regex.replace(u'[', '\\['))
+class LogView(QtWidgets.QTextBrowser):
 
     def __init__(self, parent=None):
         super(LogView, self).__init__(parent=parent)
@@ -266,12 +232,17 @@ class LogView(QtWidgets.QTextBrowser):
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
 
         self.setUndoRedoEnabled(False)
-        self._cached = u''
-        self.highlighter = LogViewHighlighter(self.document())
+        self._buffer = None
+        self._count = 0
+
+        # New log entries are highlighted in a scratch document before the
+        # formatted text is appended to the view
+        self._document = QtGui.QTextDocument(parent=self)
+        self.highlighter = LogViewHighlighter(self._document)
 
         self.timer = QtCore.QTimer(parent=self)
         self.timer.setSingleShot(False)
-        self.timer.setInterval(1000)
+        self.timer.setInterval(150)
         self.timer.timeout.connect(self.load_log)
 
     def load_log(self):
@@ -279,17 +250,50 @@ class LogView(QtWidgets.QTextBrowser):
         if app.mouseButtons() != QtCore.Qt.NoButton:
             return
 
-        self.document().blockSignals(True)
-        v = stdout.getvalue()
-        if self._cached == v:
+        # Only read what has been logged since the last update
+        mutex.lock()
+        if self._buffer is not stdout:
+            self._buffer = stdout
+            self._count = 0
+            self.clear()
+        n = min(count - self._count, len(stdout))
+        entries = list(itertools.islice(stdout, len(stdout) - n, None))
+        self._count = count
+        mutex.unlock()
+
+        if not entries:
             return
+        v = u'\n'.join(entries)[-99999:]
 
-        self._cached = v
-        self.setText(v[-99999:])  # Limit the number of characters
-        self.highlighter.rehighlight()
-        v = self.format_regex.sub(u'', self.document().toHtml())
-        self.setHtml(v)
-        self.document().blockSignals(False)
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        if not self.document().isEmpty():
+            cursor.insertBlock(self.highlighter.block_format)
+        else:
+            cursor.setBlockFormat(self.highlighter.block_format)
+
+        if u'\x1b' in v:
+            # The highlighter needs the escape sequences to colour the text so
+            # we can only strip them once the document has been highlighted
+            self._document.blockSignals(True)
+            self._document.setPlainText(v)
+            _cursor = QtGui.QTextCursor(self._document)
+            _cursor.select(QtGui.QTextCursor.Document)
+            _cursor.mergeBlockFormat(self.highlighter.block_format)
+            self.highlighter.rehighlight()
+            v = FORMAT_REGEX.sub(u'', self._document.toHtml())
+            self._document.blockSignals(False)
+            cursor.insertHtml(v)
+        else:
+            # Nothing to highlight
+            cursor.insertText(v, QtGui.QTextCharFormat())
+
+        # Limit the number of characters
+        n = self.document().characterCount() - 99999
+        if n > 0:
+            cursor.setPosition(0)
+            cursor.setPosition(n, QtGui.QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
 
         m = self.verticalScrollBar().maximum()
         self.verticalScrollBar().setValue(m)
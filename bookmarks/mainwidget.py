@@ -468,13 +468,6 @@ class MainWidget(QtWidgets.QWidget):
         if self._initialized:
             return
 
-        def emit_saved_states():
-            for flag in (common.MarkedAsActive, common.MarkedAsActive, common.MarkedAsFavourite):
-                b.filterFlagChanged.emit(flag, b.filter_flag(flag))
-                a.filterFlagChanged.emit(flag, a.filter_flag(flag))
-                f.filterFlagChanged.emit(flag, f.filter_flag(flag))
-                ff.filterFlagChanged.emit(flag, ff.filter_flag(flag))
-
         settings.local_settings.touch_mode_lockfile()
         settings.local_settings.save_mode_lockfile()
 
@@ -492,13 +485,14 @@ class MainWidget(QtWidgets.QWidget):
         f = self.fileswidget.model()
         ff = self.favouriteswidget.model()
 
+        # The filter flags are read from the proxies themselves, so re-emitting
+        # them would only repeat the invalidateFilter and button updates the
+        # text emits below already trigger
         b.filterTextChanged.emit(b.filter_text())
         a.filterTextChanged.emit(a.filter_text())
         f.filterTextChanged.emit(f.filter_text())
         ff.filterTextChanged.emit(ff.filter_text())
 
-        emit_saved_states()
-
         b.sourceModel().modelDataResetRequested.emit()
 
         if settings.local_settings.value(u'firstrun') is None:
@@ -777,7 +771,6 @@ class MainWidget(QtWidgets.QWidget):
 
         # Control bar connections
         lc.taskFolderChanged.connect(f.model().sourceModel().taskFolderChanged)
-        lc.taskFolderChanged.connect(lc.textChanged)
         f.model().sourceModel().taskFolderChanged.connect(lc.textChanged)
         #####################################################
         b.activated.connect(
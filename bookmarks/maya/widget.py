@@ -1306,11 +1306,10 @@ class MayaMainWidget(MayaQWidgetDockableMixin, QtWidgets.QWidget):
             ptr = OpenMayaUI.MQtUtil.findControl(u'ToolBox')
             if not ptr:
                 widgets = QtWidgets.QApplication.instance().allWidgets()
-                widget = [f for f in widgets if f.objectName() ==
-                          u'MayaBrowserMainButton']
+                widget = next((f for f in widgets if f.objectName() ==
+                               u'MayaBrowserMainButton'), None)
                 if not widget:
                     return
-                widget = widget[0]
 
             else:
                 widget = wrapInstance(long(ptr), QtWidgets.QWidget)
@@ -1318,7 +1317,10 @@ class MayaMainWidget(MayaQWidgetDockableMixin, QtWidgets.QWidget):
                     return
 
                 from bookmarks.maya.widget import MayaBrowserButton
-                widget = widget.findChild(MayaBrowserButton)
+                widget = widget.findChild(
+                    MayaBrowserButton, u'MayaBrowserMainButton')
+                if not widget:
+                    return
 
             widget.hide()
             widget.deleteLater()
@@ -116,6 +116,8 @@ class LocalSettings(QtCore.QSettings):
         )
 
         self.INTERNAL_SETTINGS_DATA = {}  # Internal data storage
+        self._favourites_source = None  # The raw value `_favourites` was made from
+        self._favourites = []
         self._current_mode = self.get_mode()
         self._active_paths = self.verify_paths()
 
@@ -236,14 +238,20 @@ class LocalSettings(QtCore.QSettings):
         """Get all saved favourites as a list
 
         Returns:
-            list: A list opf file paths the user marked favourite.
+            list: A sorted list of unique file paths the user marked favourite.
 
         """
         v = self.value(u'favourites')
+        if not v:
+            return []
         if isinstance(v, (str, unicode)):
-            v = [v.lower(), ]
-        v = [f.strip().lower() for f in v] if v else []
-        return v
+            v = [v, ]
+
+        # We only need to normalise the values when the saved list changes
+        if v != self._favourites_source:
+            self._favourites_source = v
+            self._favourites = sorted({f.strip().lower() for f in v})
+        return list(self._favourites)
 
 
 local_settings = LocalSettings()
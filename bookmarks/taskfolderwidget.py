@@ -328,16 +328,18 @@ class TaskFolderWidget(QtWidgets.QListView):
 
     def hideEvent(self, event):
         """TaskFolderWidget hide event."""
-        if self.parent():
-            self.parent().verticalScrollBar().setHidden(False)
-            self.parent().removeEventFilter(self)
+        parent = self.parent()
+        if parent:
+            parent.verticalScrollBar().setHidden(False)
+            parent.removeEventFilter(self)
             self.altparent.files_button.update()
 
     def showEvent(self, event):
         """TaskFolderWidget show event."""
-        if self.parent():
-            self.parent().verticalScrollBar().setHidden(True)
-            self.parent().installEventFilter(self)
+        parent = self.parent()
+        if parent:
+            parent.verticalScrollBar().setHidden(True)
+            parent.installEventFilter(self)
 
     def eventFilter(self, widget, event):
         """We're stopping events propagating back to the parent."""
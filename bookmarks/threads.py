@@ -506,25 +506,14 @@ class InfoWorker(BaseWorker):
                 if not is_valid():
                     return False
                 seq = ref()[common.SequenceRole]
+                prefix = seq.group(1)
+                suffix = seq.group(3) + u'.' + seq.group(4)
                 startpath = \
-                    seq.group(1) + \
-                    unicode(min(intframes)).zfill(padding) + \
-                    seq.group(3) + \
-                    u'.' + \
-                    seq.group(4)
+                    prefix + unicode(min(intframes)).zfill(padding) + suffix
                 endpath = \
-                    seq.group(1) + \
-                    unicode(max(intframes)).zfill(padding) + \
-                    seq.group(3) + \
-                    u'.' + \
-                    seq.group(4)
-                seqpath = \
-                    seq.group(1) + \
-                    u'[' + rangestring + u']' + \
-                    seq.group(3) + \
-                    u'.' + \
-                    seq.group(4)
-                seqname = seqpath.split(u'/')[-1]
+                    prefix + unicode(max(intframes)).zfill(padding) + suffix
+                seqpath = prefix + u'[' + rangestring + u']' + suffix
+                seqname = seqpath.rpartition(u'/')[2]
 
                 # Setting the path names
                 if not is_valid():
@@ -554,14 +543,18 @@ class InfoWorker(BaseWorker):
                 er = ref()[common.EntryRole]
                 if er:
                     mtime = 0
+                    size = 0
+                    # Tallying locally, the item is only updated once all
+                    # frames have been stat'd
                     for entry in er:
+                        if self.interrupt:
+                            return False
                         stat = entry.stat()
                         mtime = stat.st_mtime if stat.st_mtime > mtime else mtime
-                        if not is_valid():
-                            return False
-                        ref()[common.SortBySizeRole] += stat.st_size
+                        size += stat.st_size
                     if not is_valid():
                         return False
+                    ref()[common.SortBySizeRole] = size
                     ref()[common.SortByLastModifiedRole] = mtime
                     mtime = common.qlast_modified(mtime)
 
@@ -671,8 +664,7 @@ class ThumbnailWorker(BaseWorker):
         try:
             # If the image successfully loads we can wrap things up here
             if image and not image.isNull():
-                images.ImageCache.get_image(destination, int(size), force=True)
-                images.ImageCache.make_color(destination)
+                images.ImageCache.make_color(destination, int(size))
                 return True
 
             # Otherwise, we will try to generate a thumbnail using OpenImageIO
@@ -699,7 +691,7 @@ class ThumbnailWorker(BaseWorker):
             )
             if res:
                 images.ImageCache.get_image(destination, int(size), force=True)
-                images.ImageCache.make_color(destination)
+                images.ImageCache.make_color(destination, int(size))
                 return True
 
             # We should never get here ideally, but if we do we'll mark the item
@@ -711,7 +703,7 @@ class ThumbnailWorker(BaseWorker):
             )
             if res:
                 images.ImageCache.get_image(destination, int(size), force=True)
-                images.ImageCache.make_color(destination)
+                images.ImageCache.make_color(destination, int(size))
                 return True
             return False
         except:
@@ -377,7 +377,7 @@ class TodoItemEditor(QtWidgets.QTextBrowser):
         file_info = QtCore.QFileInfo(url.url())
         if file_info.exists():
             common.reveal(file_info.filePath())
-            QtGui.QClipboard().setText(file_info.filePath())
+            QtWidgets.QApplication.clipboard().setText(file_info.filePath())
         else:
             QtGui.QDesktopServices.openUrl(url)
 
@@ -459,7 +459,7 @@ class DragIndicatorButton(QtWidgets.QLabel):
             return
 
         parent_widget = self.parent()
-        editor = parent_widget.findChild(TodoItemEditor)
+        editor = parent_widget.editor
         drag = QtGui.QDrag(parent_widget)
 
         # Setting Mime Data
@@ -665,7 +665,7 @@ class TodoEditors(QtWidgets.QWidget):
 
         # Drag from another todo list
         if event.source() not in self.items:
-            text = event.source().findChild(TodoItemEditor).document().toHtml()
+            text = event.source().editor.document().toHtml()
             self.parent().parent().parent().add_item(idx=0, text=text, checked=False)
             self.separator.setHidden(True)
             return
@@ -745,6 +745,7 @@ class TodoItemWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(TodoItemWidget, self).__init__(parent=parent)
         self.editor = None
+        self.checkbox = None
         self.setFocusPolicy(QtCore.Qt.NoFocus)
         self._create_UI()
 
@@ -973,7 +974,7 @@ class TodoEditorWidget(QtWidgets.QDialog):
         hasEnabled = False
         for i in xrange(len(self.todoeditors_widget.items)):
             item = self.todoeditors_widget.items[i]
-            editor = item.findChild(TodoItemEditor)
+            editor = item.editor
             if editor.isEnabled():
                 hasEnabled = True
                 break
@@ -987,7 +988,7 @@ class TodoEditorWidget(QtWidgets.QDialog):
             if n >= len(self.todoeditors_widget.items):
                 return self._get_next_enabled(-1)
             item = self.todoeditors_widget.items[n]
-            editor = item.findChild(TodoItemEditor)
+            editor = item.editor
             if editor.isEnabled():
                 return n
 
@@ -998,14 +999,14 @@ class TodoEditorWidget(QtWidgets.QDialog):
 
         n = 0
         for n, item in enumerate(self.todoeditors_widget.items):
-            editor = item.findChild(TodoItemEditor)
+            editor = item.editor
             if editor.hasFocus():
                 break
 
         n = self._get_next_enabled(n)
         if n > -1:
             item = self.todoeditors_widget.items[n]
-            editor = item.findChild(TodoItemEditor)
+            editor = item.editor
             editor.setFocus()
             self.scrollarea.ensureWidgetVisible(
                 editor, ymargin=editor.height())
@@ -1013,8 +1014,8 @@ class TodoEditorWidget(QtWidgets.QDialog):
     def key_return(self,):
         """Control enter toggles the state of the checkbox."""
         for item in self.todoeditors_widget.items:
-            editor = item.findChild(TodoItemEditor)
-            checkbox = item.findChild(CheckBoxButton)
+            editor = item.editor
+            checkbox = item.checkbox
             if editor.hasFocus():
                 if not editor.document().toPlainText():
                     idx = self.todoeditors_widget.items.index(editor.parent())
@@ -1100,6 +1101,7 @@ class TodoEditorWidget(QtWidgets.QDialog):
         checkbox.clicked.emit(checkbox._checked)
         editor.setFocus()
         item.editor = editor
+        item.checkbox = checkbox
         return item
 
     @QtCore.Slot()
@@ -1111,8 +1113,8 @@ class TodoEditorWidget(QtWidgets.QDialog):
         data = {}
         for n in xrange(len(self.todoeditors_widget.items)):
             item = self.todoeditors_widget.items[n]
-            editor = item.findChild(TodoItemEditor)
-            checkbox = item.findChild(CheckBoxButton)
+            editor = item.editor
+            checkbox = item.checkbox
             if not editor.document().toPlainText():
                 continue
             data[n] = {